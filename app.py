@@ -6,62 +6,1091 @@
 - PDF 검토의견서 생성
 """
 
-from flask import Flask, render_template, jsonify, request, send_file
+import time
+
+# 시작 시간 측정 기준점 (모듈 import 시간 포함)
+_STARTUP_STARTED = time.perf_counter()
+
+from flask import Flask, render_template, jsonify, request, send_file, Response, stream_with_context, g, has_request_context
 import pandas as pd
-import json
+import numpy as np
 import os
-from datetime import datetime
-import io
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib import colors
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-import subprocess
-import sys
+import pickle
+from datetime import datetime, timezone
+import base64
+import json
+import re
+import threading
+import uuid
+import zipfile
+import shutil
+import gc
+import gzip
+import hashlib
+import hmac
+import itertools
+import tempfile
+from urllib.parse import quote
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from 경북연구원_검토의견서_생성기 import GyeongbukResearchInstituteReportGenerator
+from data_snapshot import read_snapshot, default_snapshot_path
+
+# brotli는 선택 의존성 (없으면 gzip만 사용)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# reportlab, openpyxl 등 무거운 선택 의존성은 사용하는 라우트에서만 로드
+_IMPORTS_SECONDS = time.perf_counter() - _STARTUP_STARTED
 
 app = Flask(__name__)
 
+# 정적 파일 캐시 유효 시간 (URL에 파일 수정 시각 버전을 붙이므로 배포 시 자동 갱신)
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 24 * 60 * 60
+
+# 전체 사업 데이터 및 등급별 CSV (등급별 CSV는 선택적 일관성 검증에만 사용)
+# DATA_CSV 환경 변수로 다른 데이터 파일 지정 가능 (벤치마크용 합성 데이터 등)
+DATA_CSV = os.environ.get('DATA_CSV', '경북_관련_사업_700개_최종선별.csv')
+GRADE_CSV_FILES = {
+    'A급_직접관련': '경북_A급_직접관련_최종선별.csv',
+    'B급_간접관련': '경북_B급_간접관련_최종선별.csv',
+    'C급_정책참고': '경북_C급_정책참고_최종선별.csv'
+}
+
+# 설정 시 로드 후 등급별 CSV와 df_all 등급 뷰의 일치 여부 검증
+VALIDATE_GRADE_CSV = os.environ.get('VALIDATE_GRADE_CSV', '').lower() in ('1', 'true', 'yes')
+
+# 필터 키 -> 범주형 컬럼 매핑 (범주 인덱스 구축 대상)
+CATEGORY_FILTER_COLUMNS = {
+    'department': '주요부처',
+    'grade': '경북관련성_최종',
+    'type': '사업유형',
+    'region': '지역관련성'
+}
+
+# 검색 대상 텍스트 컬럼
+SEARCH_COLUMNS = ['단위사업명', '사업내용']
+
+# 검색 인덱스 구축 시 한 번에 배열로 변환할 행 수 (임시 메모리 상한)
+NGRAM_BUILD_CHUNK_ROWS = 20000
+
+# 목록 API 응답 필드 -> 컬럼 매핑
+LIST_FIELD_COLUMNS = {
+    'name': '단위사업명',
+    'department': '주요부처',
+    'content': '사업내용',
+    'budget': '사업비',
+    'grade': '경북관련성_최종',
+    'type': '사업유형',
+    'region': '지역관련성'
+}
+
+# 목록 API 사업내용 요약 길이 및 최대 페이지 크기
+CONTENT_PREVIEW_LENGTH = 100
+MAX_PER_PAGE = 5000
+
+# 금액 컬럼 ("390,422,000천원" 형식 문자열 -> 천원 단위 숫자)
+MONEY_COLUMNS = ['사업비'] + [f'경비내역{i}사업비' for i in range(1, 9)]
+
+# 정렬 키 -> 숫자 컬럼 매핑 (정렬 인덱스 구축 대상)
+SORT_COLUMNS = {
+    'score': '경북관련도점수',
+    'budget': '사업비_천원',
+    'priority': '우선순위'
+}
+
+# 정렬 키 -> 문자열 컬럼 매핑 (가나다순 코드로 변환하여 정렬 인덱스 구축)
+TEXT_SORT_COLUMNS = {
+    'department': '주요부처',
+    'name': '단위사업명'
+}
+
+# 행 집합이 아니라 순서·페이지만 바꾸는 파라미터 (패싯 집계에서는 제외)
+ORDERING_KEYS = ('sort', 'cursor', 'page', 'per_page')
+
+# 범위 필터 키 -> (최소값 파라미터, 최대값 파라미터), 정렬 인덱스 사용
+RANGE_FILTERS = {
+    'budget': ('min_budget', 'max_budget'),
+    'priority': ('min_priority', 'max_priority')
+}
+
+def parse_money_column(series):
+    """금액 문자열 컬럼을 천원 단위 숫자로 일괄 변환
+
+    Returns:
+        (숫자 Series, 값이 있으나 변환에 실패한 행 여부 Series)
+    """
+    text = series.astype(object).where(series.notna(), None)
+    cleaned = (
+        text.astype(str)
+        .str.strip()
+        .str.replace(',', '', regex=False)
+        .str.replace('천원', '', regex=False)
+    )
+    numeric = pd.to_numeric(cleaned.where(text.notna(), None), errors='coerce')
+    invalid = text.notna() & numeric.isna()
+    return numeric.astype(float), invalid
+
+class SortedColumnIndex:
+    """숫자 컬럼 정렬 인덱스 (범위 필터 및 정렬용, NaN은 항상 마지막)"""
+    
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        row_count = len(values)
+        
+        # numpy 정렬은 NaN을 뒤로 보내며, stable 정렬로 동일 값은 원래 순서 유지
+        self.order = np.argsort(values, kind='stable')
+        self.sorted_values = values[self.order]
+        self.valid_count = int((~np.isnan(values)).sum())
+        
+        self.rank_asc = np.empty(row_count, dtype=np.int64)
+        self.rank_asc[self.order] = np.arange(row_count)
+        self.rank_desc = np.empty(row_count, dtype=np.int64)
+        self.rank_desc[np.argsort(-values, kind='stable')] = np.arange(row_count)
+    
+    def range(self, low=None, high=None):
+        """low 이상 high 이하 값을 가진 행 위치 배열 (행 순서 정렬)"""
+        valid_values = self.sorted_values[:self.valid_count]
+        start = 0 if low is None else np.searchsorted(valid_values, low, side='left')
+        end = self.valid_count if high is None else np.searchsorted(valid_values, high, side='right')
+        return np.sort(self.order[start:max(start, end)])
+    
+    def sort(self, positions, descending=False):
+        """행 위치 배열을 컬럼 값 기준으로 정렬"""
+        rank = self.rank_desc if descending else self.rank_asc
+        return positions[np.argsort(rank[positions], kind='stable')]
+
+# 검토의견서 임시 저장 폴더 (Vercel에서는 /tmp 사용, REPORT_TEMP_DIR 환경 변수로 변경 가능)
+# 재로드 요청 표시 파일도 이 폴더에 두므로 같은 폴더를 쓰는 프로세스끼리 재로드가 전파됨
+REPORT_TEMP_DIR = os.environ.get('REPORT_TEMP_DIR') or ('/tmp/temp_reports' if os.path.exists('/tmp') else 'temp_reports')
+
+# 검토의견서 저장소 한도 (전체 바이트, 파일 유효 시간, 정리 주기)
+REPORT_STORE_MAX_BYTES = int(os.environ.get('REPORT_STORE_MAX_BYTES', str(512 * 1024 * 1024)))
+REPORT_STORE_TTL_SECONDS = int(os.environ.get('REPORT_STORE_TTL_SECONDS', str(24 * 60 * 60)))
+REPORT_STORE_SWEEP_SECONDS = 60
+
+# 검토의견서 생성 작업 스레드 수 및 메모리에 유지할 최대 작업 수
+REPORT_JOB_WORKERS = int(os.environ.get('REPORT_JOB_WORKERS', '2'))
+MAX_REPORT_JOBS = 200
+
+# 진행 중인 작업 상태 파일 갱신 주기(초)와, 갱신이 끊긴 작업을 실패로 보는 시간(초)
+REPORT_JOB_HEARTBEAT_SECONDS = 30
+REPORT_JOB_STALE_SECONDS = 5 * 60
+
+# 검토의견서 본문 캐시 한도 (전체 문자 수, 항목 유효 시간)
+REPORT_CACHE_MAX_CHARS = int(os.environ.get('REPORT_CACHE_MAX_CHARS', str(64 * 1024 * 1024)))
+REPORT_CACHE_TTL_SECONDS = int(os.environ.get('REPORT_CACHE_TTL_SECONDS', str(24 * 60 * 60)))
+
+# 내보내기 기본 컬럼 및 한 번에 처리할 행 수
+EXPORT_COLUMNS = [
+    '단위사업명', '주요부처', '사업내용', '사업비',
+    '경북관련성_최종', '경북관련도점수', '사업유형',
+    '지역관련성', '사업기간', '시행주체'
+]
+EXPORT_CHUNK_ROWS = 1000
+
+# 응답 압축 대상 MIME 타입 및 최소 크기
+COMPRESSIBLE_MIMETYPES = {
+    'application/json', 'text/html', 'text/css', 'text/plain',
+    'application/javascript', 'text/javascript'
+}
+COMPRESS_MIN_BYTES = 512
+
+# 필터 결과 캐시 최대 항목 수
+QUERY_CACHE_SIZE = 256
+
+# 데이터 파일 변경 감시 주기(초, 0이면 감시 안 함) 및 재로드 API 관리자 토큰
+DATA_RELOAD_INTERVAL = float(os.environ.get('DATA_RELOAD_INTERVAL', '0'))
+# 데이터 파일 감시를 끈 경우에도 재로드 요청 표시 파일만 확인하는 주기(초, 0이면 확인 안 함)
+# 여러 워커(gunicorn 등) 중 재로드 API를 받은 워커 외의 워커가 이 주기 안에 따라감
+RELOAD_MARKER_INTERVAL = float(os.environ.get('RELOAD_MARKER_INTERVAL', '2'))
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
+# 압축 저장 모드: 자주 쓰는 컬럼만 메모리에 두고 나머지는 디스크에서 행 단위로 조회
+COMPACT_STORAGE = os.environ.get('COMPACT_STORAGE', '1') != '0'
+COLD_STORE_DIR = os.environ.get('COLD_STORE_DIR') or os.path.join(tempfile.gettempdir(), 'gyeongbuk_cold_columns')
+
+# 메모리에 유지할 컬럼 (목록/검색/필터/정렬/기본 내보내기/상세/검토의견서에 사용)
+HOT_COLUMNS = [
+    '단위사업명', '주요부처', '사업내용', '사업비', '사업비_천원',
+    '경북관련성_최종', '경북관련도점수', '우선순위', '사업유형', '지역관련성',
+    '사업기간', '시행주체', '지방비매칭여부'
+]
+
+# 고유값 비율이 이 값 이하인 문자열 컬럼은 category 타입으로 저장 (검색 컬럼 제외)
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+def process_rss_bytes():
+    """현재 프로세스 상주 메모리(RSS) 바이트 수 (확인할 수 없으면 None)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+def process_pss_bytes():
+    """현재 프로세스 비례 메모리(PSS) 바이트 수: fork로 공유하는 페이지는 나눠서 계산"""
+    try:
+        with open('/proc/self/smaps_rollup') as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def frame_row_hashes(frame):
+    """행 내용 해시 배열 (검토의견서 캐시 키 및 데이터 버전 계산용)"""
+    if frame.empty:
+        return np.empty(0, dtype=np.uint64)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+def frame_data_version(row_hashes):
+    """행 해시 배열로 계산한 데이터 내용 버전 문자열"""
+    return hashlib.sha1(row_hashes.tobytes()).hexdigest()[:16]
+
+class ColdColumnStoreError(RuntimeError):
+    """디스크 보관 컬럼을 읽을 수 없고 복구도 실패한 경우 (빈 값으로 응답하지 않고 오류 처리)"""
+
+class ColdColumnStore:
+    """자주 쓰지 않는 컬럼을 디스크에 행 단위 pickle로 두고 필요한 행만 읽는 저장소
+
+    파일 이름에 데이터 버전을 포함하므로 같은 데이터를 읽는 워커끼리 파일을 공유한다.
+    메모리에는 행별 파일 오프셋 배열만 유지하고, 파일은 저장소가 살아 있는 동안 열어 두고
+    os.pread로 읽는다. 열린 파일은 다른 프로세스가 지워도 계속 읽히므로 재로드 전 세대의
+    매니저나 아직 재로드하지 않은 워커도 영향을 받지 않는다 (fork된 워커가 같은 파일
+    핸들을 공유해도 pread는 파일 위치를 쓰지 않음). 읽기에 실패하면 rebuild 함수로
+    다시 만들어 저장하고, 그것도 실패하면 ColdColumnStoreError를 발생시킨다.
+    """
+    
+    # 다른 데이터 버전의 파일은 마지막으로 열린 뒤 이 시간(초)이 지나야 정리
+    # (열려 있는 파일은 지워져도 읽히므로, 정리 직전에 열려는 프로세스만 보호하면 됨)
+    STALE_FILE_SECONDS = 60 * 60
+    
+    def __init__(self, frame, data_version, root=COLD_STORE_DIR, rebuild=None):
+        self.columns = list(frame.columns)
+        self.data_version = data_version
+        self.root = root
+        self._rebuild = rebuild
+        self._lock = threading.Lock()
+        self._file = None
+        column_key = hashlib.sha1('\x1f'.join(self.columns).encode('utf-8')).hexdigest()[:8]
+        self.path = os.path.join(root, f'{data_version}-{column_key}.pkl')
+        self.offsets_path = f'{self.path}.offsets.npy'
+        
+        try:
+            offsets = np.load(self.offsets_path)
+            if len(offsets) == len(frame):
+                self._open(offsets)
+                # 사용 중인 파일이 정리 대상이 되지 않도록 수정 시각 갱신
+                os.utime(self.path)
+                os.utime(self.offsets_path)
+        except (OSError, ValueError):
+            self._file = None
+        
+        if self._file is None:
+            self._write(frame)
+        self._remove_stale_files()
+    
+    def _open(self, offsets):
+        """파일을 열고 행별 (시작, 끝) 오프셋 설정"""
+        handle = open(self.path, 'rb')
+        size = os.fstat(handle.fileno()).st_size
+        if len(offsets) and offsets[-1] >= size:
+            handle.close()
+            raise ValueError(f'저장소 파일이 오프셋보다 짧습니다: {self.path}')
+        previous, self._file = self._file, handle
+        self.offsets = offsets
+        self.ends = np.append(offsets[1:], size)
+        if previous is not None:
+            previous.close()
+    
+    def _write(self, frame):
+        """컬럼 값을 행 단위로 저장한 뒤 새 파일 열기"""
+        os.makedirs(self.root, exist_ok=True)
+        offsets = np.empty(len(frame), dtype=np.int64)
+        
+        # 임시 파일에 쓴 뒤 교체 (오프셋 파일을 마지막에 써서 완성 여부 표시)
+        temp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as f:
+            for position, values in enumerate(frame.itertuples(index=False, name=None)):
+                offsets[position] = f.tell()
+                pickle.dump(values, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.path)
+        
+        temp_offsets = f'{self.offsets_path}.{os.getpid()}.tmp.npy'
+        np.save(temp_offsets, offsets)
+        os.replace(temp_offsets, self.offsets_path)
+        self._open(offsets)
+    
+    def _remove_stale_files(self):
+        """다른 데이터 버전의 파일 중 STALE_FILE_SECONDS 동안 열리지 않은 파일 삭제"""
+        now = time.time()
+        for name in os.listdir(self.root):
+            if name.startswith(f'{self.data_version}-'):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                if now - os.path.getmtime(path) > self.STALE_FILE_SECONDS:
+                    os.remove(path)
+            except OSError:
+                pass
+    
+    def _read(self, positions):
+        handle = self._file
+        records = []
+        for position in positions:
+            start, end = int(self.offsets[position]), int(self.ends[position])
+            if hasattr(os, 'pread'):
+                data = os.pread(handle.fileno(), end - start, start)
+            else:
+                with self._lock:
+                    handle.seek(start)
+                    data = handle.read(end - start)
+            records.append(pickle.loads(data))
+        return records
+    
+    def _read_or_recover(self, positions):
+        """행 값 목록 반환, 파일을 읽을 수 없으면 복구 후 다시 읽고 실패하면 ColdColumnStoreError"""
+        handle = self._file
+        try:
+            return self._read(positions)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError) as e:
+            print(f"디스크 보관 컬럼 읽기 오류 ({self.path}): {e}")
+        
+        with self._lock:
+            # 다른 스레드가 이미 복구했으면 새 파일로 읽음
+            if self._file is handle:
+                if self._rebuild is None:
+                    raise ColdColumnStoreError(f'디스크 보관 컬럼을 읽을 수 없습니다: {self.path}')
+                try:
+                    self._write(self._rebuild())
+                    print(f"디스크 보관 컬럼 복구 완료: {self.path}")
+                except Exception as e:
+                    raise ColdColumnStoreError(f'디스크 보관 컬럼 복구 실패: {e}') from e
+        try:
+            return self._read(positions)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError) as e:
+            raise ColdColumnStoreError(f'디스크 보관 컬럼을 읽을 수 없습니다: {self.path}') from e
+    
+    def rows(self, positions, columns=None):
+        """행 위치 배열의 컬럼 값을 DataFrame으로 반환 (인덱스는 행 위치)"""
+        positions = np.asarray(positions, dtype=np.int64)
+        records = self._read_or_recover(positions)
+        frame = pd.DataFrame.from_records(records, columns=self.columns, index=positions)
+        return frame if columns is None else frame[columns]
+    
+    def row(self, position):
+        """단일 행의 컬럼 값 dict"""
+        return dict(zip(self.columns, self._read_or_recover([position])[0]))
+
+class QueryResultCache:
+    """정규화된 필터 조건별 행 위치 배열 LRU 캐시
+
+    키에 데이터셋 세대 번호를 포함하므로 데이터 재로드 시 이전 결과는 자연히 무효화된다.
+    """
+    
+    def __init__(self, max_size=QUERY_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        with self._lock:
+            positions = self._entries.get(key)
+            if positions is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return positions
+    
+    def put(self, key, positions):
+        # 여러 요청이 같은 배열을 공유하므로 읽기 전용으로 고정
+        positions.setflags(write=False)
+        with self._lock:
+            self._entries[key] = positions
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """캐시 크기 및 적중/미적중 통계 반환"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0
+            }
+
+class NgramSearchIndex:
+    """문자 n-gram 역색인 기반 부분 문자열 검색
+
+    한글은 음절 단위로 n-gram을 만들며, 공백으로 구분된 검색어는 AND 조건으로 처리한다.
+    posting list 교집합으로 후보 행을 좁힌 뒤 실제 포함 여부를 확인한다.
+    
+    n-gram은 문자 코드(21비트)를 이어 붙인 uint64 키로 표현하고, 행 묶음 단위로
+    numpy 배열 연산으로 (키, 행) 쌍을 만든 뒤 정렬하여 키별 행 위치를 연속 배열에 저장한다.
+    """
+    
+    CODE_BITS = 21  # 유니코드 최대 코드 포인트(0x10FFFF) 비트 수, 3-gram까지 uint64에 들어감
+    # str.split()이 구분자로 쓰는 공백 문자 (모두 U+3000 이하)
+    WHITESPACE_CODES = np.array([code for code in range(0x3001) if chr(code).isspace()], dtype=np.uint64)
+    
+    def __init__(self, field_texts, ngram_sizes=(1, 2, 3), chunk_rows=NGRAM_BUILD_CHUNK_ROWS):
+        # field_texts: 필드별 문자열 리스트 (행 순서 동일)
+        self.ngram_sizes = tuple(sorted(ngram_sizes))
+        if self.ngram_sizes[-1] * self.CODE_BITS > 64:
+            raise ValueError(f'n-gram 길이는 {64 // self.CODE_BITS} 이하만 지원합니다')
+        self.fields = [[str(text).lower() for text in texts] for texts in field_texts]
+        self.row_count = len(self.fields[0]) if self.fields else 0
+        
+        # 묶음별 (키별로 모인 행 위치, 키, 키별 건수)
+        chunks = [
+            self._chunk_postings(start, min(start + chunk_rows, self.row_count))
+            for start in range(0, self.row_count, chunk_rows)
+        ]
+        self.gram_keys = np.unique(np.concatenate([keys for _, keys, _ in chunks])) if chunks else np.empty(0, dtype=np.uint64)
+        
+        counts = np.zeros(len(self.gram_keys), dtype=np.int64)
+        for _, keys, key_counts in chunks:
+            counts[np.searchsorted(self.gram_keys, keys)] += key_counts
+        self.gram_offsets = np.concatenate(([0], np.cumsum(counts)))
+        
+        # 묶음 순서(행 순서)대로 키별 구간에 이어 쓰므로 키별 행 위치는 오름차순
+        self.gram_rows = np.empty(int(self.gram_offsets[-1]), dtype=np.int32)
+        cursor = self.gram_offsets[:-1].copy()
+        for rows, keys, key_counts in chunks:
+            ids = np.searchsorted(self.gram_keys, keys)
+            chunk_starts = np.cumsum(key_counts) - key_counts
+            self.gram_rows[np.repeat(cursor[ids] - chunk_starts, key_counts) + np.arange(len(rows))] = rows
+            cursor[ids] += key_counts
+    
+    def _chunk_postings(self, start, stop):
+        """행 범위의 n-gram별 행 위치 반환: (키 순으로 모인 행 위치, 고유 키, 키별 건수)"""
+        # 필드와 행을 공백으로 이어 붙이면 공백을 넘는 n-gram이 생기지 않아 행·필드 경계가 지켜짐
+        texts = [' '.join(texts) + ' ' for texts in zip(*(field[start:stop] for field in self.fields))]
+        codes = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+        row_of = np.repeat(np.arange(start, stop, dtype=np.int32), [len(text) for text in texts])
+        usable = ~np.isin(codes, self.WHITESPACE_CODES)
+        
+        keys, rows = [], []
+        for n in self.ngram_sizes:
+            count = len(codes) - n + 1
+            if count <= 0:
+                continue
+            valid = usable[:count].copy()
+            key = codes[:count].copy()
+            for offset in range(1, n):
+                valid &= usable[offset:offset + count]
+                key = (key << np.uint64(self.CODE_BITS)) | codes[offset:offset + count]
+            keys.append(key[valid])
+            rows.append(row_of[:count][valid])
+        if not keys:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+        keys = np.concatenate(keys)
+        rows = np.concatenate(rows)
+        
+        # n-gram 길이별 키 범위가 겹치지 않고 각 길이 안에서는 행이 오름차순이므로
+        # 키 기준 안정 정렬만으로 (키, 행) 순서가 됨
+        order = np.argsort(keys, kind='stable')
+        keys, rows = keys[order], rows[order]
+        distinct = np.r_[True, (keys[1:] != keys[:-1]) | (rows[1:] != rows[:-1])] if len(keys) else np.empty(0, dtype=bool)
+        keys, rows = keys[distinct], rows[distinct]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.empty(0, dtype=np.int64)
+        return rows, keys[starts], np.diff(np.append(starts, len(keys)))
+    
+    def _gram_key(self, gram):
+        key = 0
+        for char in gram:
+            key = (key << self.CODE_BITS) | ord(char)
+        return key
+    
+    def posting(self, gram):
+        """n-gram을 포함하는 행 위치 배열 (오름차순)"""
+        key = self._gram_key(gram)
+        i = int(np.searchsorted(self.gram_keys, np.uint64(key)))
+        if i == len(self.gram_keys) or int(self.gram_keys[i]) != key:
+            return np.empty(0, dtype=np.int64)
+        return self.gram_rows[self.gram_offsets[i]:self.gram_offsets[i + 1]].astype(np.int64)
+    
+    def _term_grams(self, term):
+        """검색어에서 사용할 가장 긴 n-gram 집합 반환"""
+        usable = [n for n in self.ngram_sizes if n <= len(term)]
+        if not usable:
+            return set()
+        n = usable[-1]
+        return {term[i:i + n] for i in range(len(term) - n + 1)}
+    
+    def search(self, query, positions=None):
+        """검색어(공백 구분 AND)를 포함하는 행 위치 배열 반환
+
+        positions가 주어지면 해당 행 위치 안에서만 검색한다.
+        """
+        terms = list(dict.fromkeys(str(query).lower().split()))
+        if not terms:
+            return np.arange(self.row_count, dtype=np.int64) if positions is None else positions
+        
+        candidates = positions
+        empty = np.empty(0, dtype=np.int64)
+        for term in terms:
+            postings = sorted((self.posting(gram) for gram in self._term_grams(term)), key=len)
+            for posting in postings:
+                if candidates is None:
+                    candidates = posting
+                else:
+                    candidates = np.intersect1d(candidates, posting, assume_unique=True)
+                if len(candidates) == 0:
+                    return empty
+        
+        if candidates is None:
+            candidates = np.arange(self.row_count, dtype=np.int64)
+        
+        # 후보 검증: 모든 검색어가 어느 한 필드에 실제로 포함되어야 함
+        matched = [
+            row for row in candidates.tolist()
+            if all(any(term in field[row] for field in self.fields) for term in terms)
+        ]
+        return np.asarray(matched, dtype=np.int64)
+
+class ReportCache:
+    """사업 행 내용 해시 + 템플릿 버전을 키로 하는 검토의견서 본문 캐시
+
+    본문은 검토일자 자리 표시자가 들어간 상태로 저장되며, 전체 문자 수 한도와
+    유효 시간을 넘으면 오래 사용하지 않은 항목부터 제거한다.
+    """
+    
+    def __init__(self, max_chars=REPORT_CACHE_MAX_CHARS, ttl_seconds=REPORT_CACHE_TTL_SECONDS):
+        self.max_chars = max_chars
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (저장 시각, (파일명, 본문, 우선순위))
+        self._lock = threading.Lock()
+        self.total_chars = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def put(self, key, report):
+        size = len(report[1])
+        if size > self.max_chars:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key, evicted=False)
+            self._entries[key] = (time.monotonic(), report)
+            self.total_chars += size
+            while self.total_chars > self.max_chars:
+                self._remove(next(iter(self._entries)))
+    
+    def _remove(self, key, evicted=True):
+        _, report = self._entries.pop(key)
+        self.total_chars -= len(report[1])
+        if evicted:
+            self.evictions += 1
+    
+    def stats(self):
+        """캐시 크기 및 적중/미적중 통계 반환"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'total_chars': self.total_chars,
+                'max_chars': self.max_chars,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0
+            }
+
+class ReportStore:
+    """검토의견서 디스크 저장소
+
+    파일은 root/files/<파일 ID>/<파일명> 에 저장되어 파일 ID로 바로 찾을 수 있고,
+    사용자 입력 경로를 그대로 쓰지 않는다. 이전 파일명 다운로드 경로를 위해
+    root/names/<파일명 해시> 에 가장 최근 파일 ID를 기록한다(모든 워커가 공유).
+    주기적인 정리에서 유효 시간이 지난 파일·이름 기록과 작업 상태(root/jobs)를 지우고,
+    전체 크기가 한도를 넘으면 오래된 파일부터 지운다. 디렉터리를 직접 훑어 정리하므로
+    여러 gunicorn 워커가 저장한 파일도 함께 관리된다.
+    """
+    
+    def __init__(self, root, max_bytes=REPORT_STORE_MAX_BYTES, ttl_seconds=REPORT_STORE_TTL_SECONDS,
+                 sweep_interval=REPORT_STORE_SWEEP_SECONDS):
+        self.root = root
+        self.files_dir = os.path.join(root, 'files')
+        self.job_dir = os.path.join(root, 'jobs')
+        self.names_dir = os.path.join(root, 'names')
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval = sweep_interval
+        self._sweep_lock = threading.Lock()
+        self._last_sweep = 0
+        self.last_sweep_stats = {'files': 0, 'bytes': 0, 'removed': 0}
+    
+    def save(self, filename, content):
+        """본문 저장 후 (파일 ID, 경로) 반환"""
+        filename = os.path.basename(filename)
+        file_id = uuid.uuid4().hex
+        directory = os.path.join(self.files_dir, file_id)
+        os.makedirs(directory)
+        path = os.path.join(directory, filename)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        # 파일명 -> 최근 파일 ID 기록 (임시 파일 후 교체, 읽는 쪽은 항상 완전한 ID를 봄)
+        os.makedirs(self.names_dir, exist_ok=True)
+        name_path = self._name_path(filename)
+        temp_path = f'{name_path}.{file_id}.tmp'
+        with open(temp_path, 'w', encoding='ascii') as f:
+            f.write(file_id)
+        os.replace(temp_path, name_path)
+        self._maybe_sweep()
+        return file_id, path
+    
+    def resolve(self, file_id):
+        """파일 ID -> (파일명, 경로), 없거나 만료되었으면 None"""
+        if not isinstance(file_id, str) or not re.fullmatch(r'[0-9a-f]{32}', file_id):
+            return None
+        directory = os.path.join(self.files_dir, file_id)
+        try:
+            filename = os.listdir(directory)[0]
+            path = os.path.join(directory, filename)
+            expired = time.time() - os.path.getmtime(path) > self.ttl_seconds
+        except (OSError, IndexError):
+            return None
+        
+        if expired:
+            shutil.rmtree(directory, ignore_errors=True)
+            return None
+        return filename, path
+    
+    def resolve_name(self, filename):
+        """파일명 -> (파일명, 경로) (경로 구분자·상위 경로가 들어간 이름은 거부)"""
+        if not filename or filename in ('.', '..') or os.path.basename(filename) != filename:
+            return None
+        try:
+            with open(self._name_path(filename), encoding='ascii') as f:
+                file_id = f.read().strip()
+        except OSError:
+            return None
+        resolved = self.resolve(file_id)
+        # 해시 충돌 대비 실제 파일명 확인
+        if resolved is None or resolved[0] != filename:
+            return None
+        return resolved
+    
+    def _name_path(self, filename):
+        return os.path.join(self.names_dir, hashlib.sha1(filename.encode('utf-8')).hexdigest())
+    
+    def _maybe_sweep(self):
+        if time.monotonic() - self._last_sweep < self.sweep_interval:
+            return
+        # 다른 스레드가 정리 중이면 기다리지 않음
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_sweep = time.monotonic()
+            self.sweep()
+        finally:
+            self._sweep_lock.release()
+    
+    def sweep(self):
+        """만료 파일·작업 상태 삭제 후 크기 한도까지 오래된 파일부터 삭제"""
+        now = time.time()
+        entries = []  # (수정 시각, 크기, 파일 ID)
+        removed = 0
+        
+        try:
+            file_ids = os.listdir(self.files_dir)
+        except OSError:
+            file_ids = []
+        
+        for file_id in file_ids:
+            directory = os.path.join(self.files_dir, file_id)
+            try:
+                stats = [os.stat(os.path.join(directory, name)) for name in os.listdir(directory)]
+                # 빈 디렉터리는 save()가 막 만들고 아직 파일을 쓰기 전일 수 있으므로 디렉터리 자체 시각으로 판단
+                modified = max(stat.st_mtime for stat in stats) if stats else os.stat(directory).st_mtime
+            except OSError:
+                continue
+            if now - modified > self.ttl_seconds:
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+                continue
+            entries.append((modified, sum(stat.st_size for stat in stats), file_id))
+        
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and total_bytes > self.max_bytes:
+            _, size, file_id = entries.pop(0)
+            shutil.rmtree(os.path.join(self.files_dir, file_id), ignore_errors=True)
+            total_bytes -= size
+            removed += 1
+        
+        # 만료된 작업 상태 파일·파일명 기록 (가리키는 파일이 크기 한도로 먼저 지워진 기록은 resolve에서 걸러짐)
+        for state_dir in (self.job_dir, self.names_dir):
+            try:
+                names = os.listdir(state_dir)
+            except OSError:
+                continue
+            for name in names:
+                path = os.path.join(state_dir, name)
+                try:
+                    if now - os.path.getmtime(path) > self.ttl_seconds:
+                        os.remove(path)
+                except OSError:
+                    continue
+        
+        self.last_sweep_stats = {'files': len(entries), 'bytes': total_bytes, 'removed': removed}
+        return self.last_sweep_stats
+
 class GyeongbukProjectManager:
-    def __init__(self):
-        """경북 사업 관리자 초기화"""
+    def __init__(self, generation=0, query_cache=None):
+        """경북 사업 관리자 초기화
+
+        Args:
+            generation: 이전 데이터셋 세대 번호 (재로드 시 이전 매니저의 값, 로드하며 1 증가)
+            query_cache: 세대 번호를 키에 포함하는 필터 결과 캐시 (재로드 시 공유)
+        """
+        self.generation = generation
+        self.query_cache = query_cache if query_cache is not None else QueryResultCache()
+        self._report_generator = None  # (데이터 세대, 생성기)
+        self._report_generator_lock = threading.Lock()
+        
+        started = time.perf_counter()
         self.load_data()
+        loaded = time.perf_counter()
+        # 행 해시는 모든 컬럼 기준이므로 컬럼 압축 전에 계산
+        self.build_row_hashes()
+        self.compact_columns()
+        self.build_category_index()
+        self.build_grade_views()
+        self.build_search_index()
+        self.build_sort_index()
+        self.build_facet_index()
         self.setup_filters()
+        indexed = time.perf_counter()
+        
+        self.startup_timings = {
+            'data_load_seconds': round(loaded - started, 4),
+            'index_build_seconds': round(indexed - loaded, 4)
+        }
     
     def load_data(self):
         """CSV 데이터 로드"""
+        # 데이터셋 세대 번호: 필터 결과 캐시 키에 포함
+        self.generation += 1
         try:
-            # 전체 700개 사업 데이터
-            self.df_all = pd.read_csv('경북_관련_사업_700개_최종선별.csv')
+            # 전체 700개 사업 데이터 (등급별 데이터는 df_all 위의 행 위치 뷰로 구성)
+            # 유효한 바이너리 스냅샷이 있으면 CSV 파싱 생략
+            started = time.perf_counter()
+            df, source = self.read_source()
+            self.df_all = df
+            self.source_columns = list(df.columns)  # 원본 CSV 컬럼 (파생 컬럼 제외)
+            self.load_stats = {'source': source, 'seconds': round(time.perf_counter() - started, 4)}
+            print(f"데이터 로드 경로: {source} ({self.load_stats['seconds']:.3f}초)")
             
-            # 등급별 데이터
-            self.df_a = pd.read_csv('경북_A급_직접관련_최종선별.csv')
-            self.df_b = pd.read_csv('경북_B급_간접관련_최종선별.csv') 
-            self.df_c = pd.read_csv('경북_C급_정책참고_최종선별.csv')
-            
-            print(f"데이터 로드 완료: 전체 {len(self.df_all)}개 사업")
-            print(f"- A급: {len(self.df_a)}개")
-            print(f"- B급: {len(self.df_b)}개") 
-            print(f"- C급: {len(self.df_c)}개")
+            self.add_derived_columns(self.df_all)
             
         except Exception as e:
             print(f"데이터 로드 오류: {e}")
             # 빈 DataFrame 생성
             self.df_all = pd.DataFrame()
-            self.df_a = pd.DataFrame()
-            self.df_b = pd.DataFrame()
-            self.df_c = pd.DataFrame()
+            self.source_columns = []
+            self.load_stats = {'source': None, 'seconds': 0}
+        
+        # 데이터 수정 시각 (Last-Modified 헤더)
+        try:
+            self.data_modified_at = datetime.fromtimestamp(int(os.path.getmtime(DATA_CSV)), tz=timezone.utc)
+        except OSError:
+            self.data_modified_at = None
+    
+    def read_source(self):
+        """원본 데이터 읽기 (유효한 바이너리 스냅샷이 있으면 CSV 파싱 생략), (DataFrame, 경로 종류) 반환"""
+        df = read_snapshot(DATA_CSV)
+        if df is not None:
+            return df, 'snapshot'
+        return pd.read_csv(DATA_CSV), 'csv'
+    
+    def add_derived_columns(self, frame):
+        """금액 숫자 컬럼과 우선순위 컬럼 추가"""
+        self.parse_money_columns(frame)
+        
+        # 우선순위 % 일괄 계산 (검토의견서 생성 없이 정렬/필터에 사용)
+        frame['우선순위'] = GyeongbukResearchInstituteReportGenerator.calculate_priority_percentages(frame)
+    
+    def read_cold_frame(self, columns, data_version):
+        """디스크 보관 컬럼 재구성 (저장소 파일이 사라졌을 때 원본 데이터에서 복구)
+        
+        Raises:
+            ValueError: 원본 데이터가 로드 시점과 달라 같은 값을 만들 수 없는 경우
+        """
+        frame, _ = self.read_source()
+        self.add_derived_columns(frame)
+        if frame_data_version(frame_row_hashes(frame)) != data_version:
+            raise ValueError('원본 데이터가 로드 이후 변경되어 디스크 보관 컬럼을 복구할 수 없습니다.')
+        return frame[columns]
+    
+    def build_grade_views(self):
+        """등급별 행 위치 배열 구성 (별도 CSV 로드 및 데이터 복사 없음)"""
+        grade_index = self.category_index.get('경북관련성_최종', {})
+        empty = np.empty(0, dtype=np.int64)
+        self.grade_positions = {grade: grade_index.get(grade, empty) for grade in GRADE_CSV_FILES}
+        
+        print(f"데이터 로드 완료: 전체 {len(self.df_all)}개 사업")
+        print(f"- A급: {len(self.grade_positions['A급_직접관련'])}개")
+        print(f"- B급: {len(self.grade_positions['B급_간접관련'])}개")
+        print(f"- C급: {len(self.grade_positions['C급_정책참고'])}개")
+        
+        if VALIDATE_GRADE_CSV:
+            self.validate_grade_views()
+    
+    def get_grade_frame(self, grade):
+        """등급별 DataFrame 반환 (필요할 때만 df_all에서 추출)"""
+        return self.df_all.iloc[self.grade_positions[grade]]
+    
+    @property
+    def df_a(self):
+        return self.get_grade_frame('A급_직접관련')
+    
+    @property
+    def df_b(self):
+        return self.get_grade_frame('B급_간접관련')
+    
+    @property
+    def df_c(self):
+        return self.get_grade_frame('C급_정책참고')
+    
+    def validate_grade_views(self):
+        """등급별 CSV와 df_all 등급 뷰 일치 여부 검증, 불일치 등급 목록 반환"""
+        mismatched = []
+        for grade, path in GRADE_CSV_FILES.items():
+            try:
+                expected = pd.read_csv(path)
+                actual = self.project_frame(self.grade_positions[grade], list(expected.columns)).reset_index(drop=True)
+                pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+            except Exception as e:
+                print(f"- {grade} 등급 CSV 불일치 ({path}): {str(e)[:100]}")
+                mismatched.append(grade)
+        
+        if not mismatched:
+            print("- 등급별 CSV 일관성 검증 통과")
+        return mismatched
+    
+    def parse_money_columns(self, frame):
+        """금액 컬럼을 로드 시점에 한 번만 숫자로 변환
+
+        각 금액 컬럼마다 '<컬럼>_천원'(float, 결측/오류는 NaN)과
+        '<컬럼>_파싱오류'(값이 있으나 변환 실패) 컬럼을 추가한다.
+        """
+        for column in MONEY_COLUMNS:
+            if column not in frame.columns:
+                continue
+            numeric, invalid = parse_money_column(frame[column])
+            frame[f'{column}_천원'] = numeric
+            frame[f'{column}_파싱오류'] = invalid
+            if invalid.any():
+                print(f"- {column} 금액 변환 실패: {int(invalid.sum())}건")
+    
+    def compact_columns(self):
+        """메모리 절약용 컬럼 정리 (COMPACT_STORAGE 모드)
+        
+        HOT_COLUMNS 외의 컬럼은 ColdColumnStore로 옮기고, 고유값이 적은 문자열
+        컬럼은 category, 우선순위는 작은 정수 타입으로 바꾼다. 금액·점수는
+        정밀도 유지를 위해 float64로 둔다.
+        """
+        self.cold_store = None
+        before = int(self.df_all.memory_usage(deep=True).sum()) if not self.df_all.empty else 0
+        self.memory_stats = {
+            'compact_storage': COMPACT_STORAGE,
+            'frame_bytes_before': before,
+            'frame_bytes_after': before,
+            'rss_bytes_before': process_rss_bytes(),
+            'cold_columns': 0
+        }
+        if not COMPACT_STORAGE or self.df_all.empty:
+            self.memory_stats['rss_bytes_after'] = self.memory_stats['rss_bytes_before']
+            return
+        
+        cold_columns = [column for column in self.df_all.columns if column not in HOT_COLUMNS]
+        if cold_columns:
+            try:
+                data_version = self.data_version
+                self.cold_store = ColdColumnStore(
+                    self.df_all[cold_columns], data_version,
+                    rebuild=lambda: self.read_cold_frame(cold_columns, data_version)
+                )
+                self.df_all = self.df_all.drop(columns=cold_columns)
+            except OSError as e:
+                print(f"콜드 컬럼 저장소 생성 오류 (전체 컬럼을 메모리에 유지): {e}")
+        
+        row_count = len(self.df_all)
+        for column in self.df_all.columns:
+            series = self.df_all[column]
+            if column in SEARCH_COLUMNS or not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+                continue
+            if series.nunique(dropna=True) <= row_count * CATEGORY_MAX_UNIQUE_RATIO:
+                self.df_all[column] = series.astype(object).astype('category')
+        
+        if '우선순위' in self.df_all.columns:
+            self.df_all['우선순위'] = pd.to_numeric(self.df_all['우선순위'], downcast='integer')
+        
+        # 제거한 컬럼의 메모리를 바로 반환받은 뒤 RSS 측정
+        gc.collect()
+        self.memory_stats['frame_bytes_after'] = int(self.df_all.memory_usage(deep=True).sum())
+        self.memory_stats['cold_columns'] = len(self.cold_store.columns) if self.cold_store else 0
+        self.memory_stats['rss_bytes_after'] = process_rss_bytes()
+        print(
+            f"컬럼 압축: DataFrame {before / 1e6:.1f}MB -> {self.memory_stats['frame_bytes_after'] / 1e6:.1f}MB "
+            f"(디스크 보관 컬럼 {self.memory_stats['cold_columns']}개)"
+        )
+    
+    def project_frame(self, positions, columns):
+        """행 위치 배열의 지정 컬럼 DataFrame (디스크 보관 컬럼 포함, category는 원래 값으로)"""
+        hot = [column for column in columns if column in self.df_all.columns]
+        frame = self.df_all.iloc[positions][hot]
+        cold = [column for column in columns if column not in self.df_all.columns]
+        if cold and self.cold_store is not None:
+            cold_frame = self.cold_store.rows(positions, [c for c in cold if c in self.cold_store.columns])
+            cold_frame.index = frame.index
+            frame = pd.concat([frame, cold_frame], axis=1)
+        frame = frame.reindex(columns=columns)
+        
+        categorical = [column for column in columns if isinstance(frame[column].dtype, pd.CategoricalDtype)]
+        if categorical:
+            frame = frame.astype({column: object for column in categorical})
+        return frame
+    
+    def has_column(self, column):
+        """메모리 또는 디스크 보관 컬럼 중 존재 여부"""
+        if column in self.df_all.columns:
+            return True
+        return self.cold_store is not None and column in self.cold_store.columns
+    
+    def project_value(self, index, column, default=''):
+        """단일 행의 컬럼 값 (디스크 보관 컬럼은 해당 행만 읽음)"""
+        if column in self.df_all.columns:
+            return self.df_all[column].iat[index]
+        if self.cold_store is not None and column in self.cold_store.columns:
+            return self.cold_store.row(index)[column]
+        return default
+    
+    def build_category_index(self):
+        """범주형 컬럼별 값 -> 행 위치 배열 인덱스 구축
+
+        필터링 시 전체 컬럼 비교 대신 미리 계산된 행 위치 배열의 교집합을 사용한다.
+        """
+        self.category_index = {}
+        for column in CATEGORY_FILTER_COLUMNS.values():
+            if column not in self.df_all.columns:
+                self.category_index[column] = {}
+                continue
+            # groupby().indices: 값별 정렬된 행 위치(np.ndarray) 반환, NaN 제외
+            self.category_index[column] = {
+                value: positions.astype(np.int64)
+                for value, positions in self.df_all.groupby(column, sort=True, observed=True).indices.items()
+            }
+    
+    def build_search_index(self):
+        """단위사업명/사업내용 n-gram 검색 인덱스 구축"""
+        field_texts = [
+            self.df_all[column].fillna('').astype(str).tolist() if column in self.df_all.columns else [''] * len(self.df_all)
+            for column in SEARCH_COLUMNS
+        ]
+        self.search_index = NgramSearchIndex(field_texts)
+    
+    def build_sort_index(self):
+        """컬럼별 정렬 인덱스 구축 (범위 필터 및 서버측 정렬용)"""
+        self.sort_indexes = {
+            key: SortedColumnIndex(self.df_all[column].to_numpy(dtype=float))
+            for key, column in SORT_COLUMNS.items()
+            if column in self.df_all.columns
+        }
+        
+        # 문자열 컬럼은 정렬된 고유값 순번(빈 값은 NaN)으로 바꿔 같은 인덱스 사용
+        for key, column in TEXT_SORT_COLUMNS.items():
+            if column not in self.df_all.columns:
+                continue
+            codes, _ = pd.factorize(self.df_all[column].astype(object), sort=True)
+            values = codes.astype(float)
+            values[codes < 0] = np.nan
+            self.sort_indexes[key] = SortedColumnIndex(values)
+    
+    def build_facet_index(self):
+        """범주형 필터 컬럼별 값 코드 행렬 구축 (패싯 집계용)
+        
+        컬럼마다 정렬된 값 코드에 오프셋을 더해 하나의 bincount로 모든 컬럼을
+        한 번에 집계한다. 각 컬럼의 마지막 코드는 빈 값 자리이다.
+        """
+        row_count = len(self.df_all)
+        self.facet_values = {}
+        codes_by_column = []
+        offsets = []
+        bucket_count = 0
+        
+        for key, column in CATEGORY_FILTER_COLUMNS.items():
+            if column in self.df_all.columns:
+                codes, uniques = pd.factorize(self.df_all[column], sort=True)
+                values = [str(value) for value in uniques]
+            else:
+                codes, values = np.full(row_count, -1, dtype=np.int64), []
+            # 빈 값(-1)은 컬럼의 마지막 코드로 이동
+            codes = np.where(codes < 0, len(values), codes)
+            
+            self.facet_values[key] = values
+            codes_by_column.append(codes + bucket_count)
+            offsets.append(bucket_count)
+            bucket_count += len(values) + 1
+        
+        self.facet_codes = np.vstack(codes_by_column).astype(np.int64) if codes_by_column else np.empty((0, row_count), dtype=np.int64)
+        self.facet_offsets = offsets
+        self.facet_bucket_count = bucket_count
+        
+        # 사업비 합계 가중치 (천원, 값이 없으면 0)
+        if '사업비_천원' in self.df_all.columns:
+            self.facet_budget = np.nan_to_num(self.df_all['사업비_천원'].to_numpy(dtype=float))
+        else:
+            self.facet_budget = np.zeros(row_count)
+    
+    def build_row_hashes(self):
+        """행 내용 해시 계산 (검토의견서 캐시 키)"""
+        self.row_hashes = frame_row_hashes(self.df_all)
+        
+        # 데이터 내용 버전 (ETag): 워커·재시작과 무관하게 같은 데이터면 같은 값
+        self.data_version = frame_data_version(self.row_hashes)
     
     def setup_filters(self):
         """필터 옵션 설정"""
         if not self.df_all.empty:
             self.filter_options = {
-                'departments': sorted(self.df_all['주요부처'].dropna().unique().tolist()),
-                'grades': sorted(self.df_all['경북관련성_최종'].dropna().unique().tolist()),
-                'types': sorted(self.df_all['사업유형'].dropna().unique().tolist()),
-                'regions': sorted(self.df_all['지역관련성'].dropna().unique().tolist())
+                'departments': sorted(self.category_index['주요부처'].keys()),
+                'grades': sorted(self.category_index['경북관련성_최종'].keys()),
+                'types': sorted(self.category_index['사업유형'].keys()),
+                'regions': sorted(self.category_index['지역관련성'].keys())
             }
         else:
             self.filter_options = {
@@ -84,42 +1113,252 @@ class GyeongbukProjectManager:
         
         return {
             'total_projects': len(self.df_all),
-            'a_grade_count': len(self.df_a),
-            'b_grade_count': len(self.df_b),
-            'c_grade_count': len(self.df_c),
+            'a_grade_count': len(self.grade_positions['A급_직접관련']),
+            'b_grade_count': len(self.grade_positions['B급_간접관련']),
+            'c_grade_count': len(self.grade_positions['C급_정책참고']),
             'avg_score': round(self.df_all['경북관련도점수'].mean(), 1) if '경북관련도점수' in self.df_all.columns else 0
         }
     
-    def filter_projects(self, filters):
-        """프로젝트 필터링"""
-        df = self.df_all.copy()
+    def normalize_filters(self, filters):
+        """필터 조건을 캐시 키로 쓸 수 있는 정규화된 튜플로 변환"""
+        normalized = []
+        for key in CATEGORY_FILTER_COLUMNS:
+            value = filters.get(key)
+            if value is not None and str(value).strip():
+                normalized.append((key, str(value).strip()))
         
-        if filters.get('department'):
-            df = df[df['주요부처'] == filters['department']]
+        if filters.get('search') and str(filters['search']).strip():
+            # 검색어는 AND 조건이므로 순서와 중복을 무시
+            terms = sorted(set(str(filters['search']).lower().split()))
+            normalized.append(('search', ' '.join(terms)))
         
-        if filters.get('grade'):
-            df = df[df['경북관련성_최종'] == filters['grade']]
+        if filters.get('min_score') not in (None, '') and filters.get('max_score') not in (None, ''):
+            normalized.append(('min_score', float(filters['min_score'])))
+            normalized.append(('max_score', float(filters['max_score'])))
         
-        if filters.get('type'):
-            df = df[df['사업유형'] == filters['type']]
+        # 사업비(천원)/우선순위 범위 (한쪽만 지정 가능)
+        for min_key, max_key in RANGE_FILTERS.values():
+            for key in (min_key, max_key):
+                if filters.get(key) not in (None, ''):
+                    normalized.append((key, float(filters[key])))
         
-        if filters.get('region'):
-            df = df[df['지역관련성'] == filters['region']]
+        # 정렬: '<키>'(오름차순) / '-<키>'(내림차순), 키는 SORT_COLUMNS/TEXT_SORT_COLUMNS 참조
+        sort = filters.get('sort')
+        if sort and str(sort).lstrip('-') in self.sort_indexes:
+            normalized.append(('sort', str(sort)))
         
-        if filters.get('search'):
-            search_term = filters['search'].lower()
-            df = df[
-                df['단위사업명'].str.lower().str.contains(search_term, na=False) |
-                df['사업내용'].str.lower().str.contains(search_term, na=False)
+        return tuple(normalized)
+    
+    def filter_positions(self, filters):
+        """필터 조건에 맞는 행 위치 배열 반환 (LRU 캐시 사용, 읽기 전용 배열)"""
+        normalized = self.normalize_filters(filters)
+        key = (self.generation, normalized)
+        
+        positions = self.query_cache.get(key)
+        if positions is None:
+            positions = self._compute_positions(dict(normalized))
+            self.query_cache.put(key, positions)
+        return positions
+    
+    def _compute_positions(self, filters):
+        """정규화된 필터 조건으로 행 위치 배열 계산 (DataFrame 복사 없음)"""
+        positions = None
+        
+        # 범주형 필터: 미리 구축한 행 위치 배열의 교집합
+        for key, column in CATEGORY_FILTER_COLUMNS.items():
+            value = filters.get(key)
+            if not value:
+                continue
+            matched = self.category_index.get(column, {}).get(value)
+            if matched is None:
+                return np.empty(0, dtype=np.int64)
+            if positions is None:
+                positions = matched.copy()
+            else:
+                positions = np.intersect1d(positions, matched, assume_unique=True)
+        
+        if positions is None:
+            positions = np.arange(len(self.df_all), dtype=np.int64)
+        
+        if filters.get('search') and len(positions):
+            # n-gram 역색인 기반 검색 (공백 구분 검색어는 AND 조건)
+            positions = self.search_index.search(filters['search'], positions)
+        
+        if filters.get('min_score') is not None and filters.get('max_score') is not None and len(positions):
+            scores = self.df_all['경북관련도점수'].to_numpy()[positions]
+            positions = positions[
+                (scores >= filters['min_score']) &
+                (scores <= filters['max_score'])
             ]
         
-        if filters.get('min_score') is not None and filters.get('max_score') is not None:
-            df = df[
-                (df['경북관련도점수'] >= filters['min_score']) &
-                (df['경북관련도점수'] <= filters['max_score'])
+        for key, (min_key, max_key) in RANGE_FILTERS.items():
+            low, high = filters.get(min_key), filters.get(max_key)
+            if (low is not None or high is not None) and len(positions) and key in self.sort_indexes:
+                range_rows = self.sort_indexes[key].range(low, high)
+                positions = np.intersect1d(positions, range_rows, assume_unique=True)
+        
+        if filters.get('sort'):
+            sort = filters['sort']
+            positions = self.sort_indexes[sort.lstrip('-')].sort(positions, descending=sort.startswith('-'))
+        
+        return positions
+    
+    def sort_rank(self, sort):
+        """정렬 기준 순위 배열 (정렬 없음이면 None: 행 위치 자체가 순위)"""
+        if not sort:
+            return None
+        index = self.sort_indexes[sort.lstrip('-')]
+        return index.rank_desc if sort.startswith('-') else index.rank_asc
+    
+    def encode_cursor(self, sort, position):
+        """페이지 마지막 행 위치를 키셋 페이징 커서(불투명 문자열)로 변환"""
+        rank = self.sort_rank(sort)
+        payload = {
+            's': sort or '',
+            'k': int(position if rank is None else rank[position]),
+            'v': self.data_version
+        }
+        raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+    
+    def seek_cursor(self, positions, sort, cursor):
+        """커서 다음 행이 정렬된 위치 배열에서 시작하는 인덱스 (이진 탐색)
+        
+        Raises:
+            ValueError: 커서 형식이 잘못되었거나 정렬/데이터가 달라진 경우
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            payload = json.loads(raw.decode('utf-8'))
+            after = int(payload['k'])
+        except (ValueError, TypeError, KeyError, UnicodeDecodeError) as e:
+            raise ValueError('잘못된 커서입니다.') from e
+        
+        if payload.get('s', '') != (sort or ''):
+            raise ValueError('커서의 정렬 기준이 요청과 다릅니다.')
+        if payload.get('v') != self.data_version:
+            raise ValueError('데이터가 갱신되어 커서가 만료되었습니다.')
+        
+        rank = self.sort_rank(sort)
+        if rank is None:
+            return int(np.searchsorted(positions, after, side='right'))
+        
+        # 위치 배열은 순위 오름차순이므로 순위를 필요한 만큼만 조회하며 이진 탐색
+        low, high = 0, len(positions)
+        while low < high:
+            mid = (low + high) // 2
+            if rank[positions[mid]] <= after:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+    
+    def get_facets(self, filters):
+        """필터 조건별 범주형 컬럼 값의 건수/사업비 합계
+        
+        선택된 컬럼은 자기 조건만 뺀 결과로 집계하여 다른 값으로 바꿀 때의
+        건수를 보여준다. 같은 행 집합을 쓰는 컬럼끼리는 bincount 한 번으로 집계한다.
+        정렬·페이지 파라미터는 집계 결과와 무관하므로 빼고 행 집합(캐시 키)을 구한다.
+        """
+        filters = {k: v for k, v in filters.items() if k not in ORDERING_KEYS}
+        normalized = dict(self.normalize_filters(filters))
+        base_positions = self.filter_positions(normalized)
+        
+        # 행 집합별로 집계할 컬럼 묶기 (조건이 없으면 모두 기본 결과 사용)
+        groups = [(base_positions, [])]
+        for row, key in enumerate(CATEGORY_FILTER_COLUMNS):
+            if key in normalized:
+                others = {k: v for k, v in normalized.items() if k != key}
+                groups.append((self.filter_positions(others), [row]))
+            else:
+                groups[0][1].append(row)
+        
+        counts = np.zeros(self.facet_bucket_count, dtype=np.int64)
+        budgets = np.zeros(self.facet_bucket_count)
+        for positions, rows in groups:
+            if not rows or not len(positions):
+                continue
+            flat_codes = self.facet_codes[rows][:, positions].ravel()
+            weights = np.tile(self.facet_budget[positions], len(rows))
+            counts += np.bincount(flat_codes, minlength=self.facet_bucket_count)
+            budgets += np.bincount(flat_codes, weights=weights, minlength=self.facet_bucket_count)
+        
+        facets = {}
+        for key, offset in zip(CATEGORY_FILTER_COLUMNS, self.facet_offsets):
+            values = self.facet_values[key]
+            facets[key] = [
+                {
+                    'value': value,
+                    'count': int(counts[offset + code]),
+                    'budget_thousand': float(budgets[offset + code])
+                }
+                for code, value in enumerate(values)
             ]
         
-        return df
+        return {
+            'total': len(base_positions),
+            'facets': facets
+        }
+    
+    def filter_projects(self, filters):
+        """프로젝트 필터링"""
+        return self.df_all.iloc[self.filter_positions(filters)]
+    
+    def _column_as_str(self, frame, column):
+        """컬럼을 str() 변환과 동일한 문자열 배열로 일괄 변환"""
+        if column not in frame.columns:
+            return np.full(len(frame), '', dtype='<U1')
+        return np.asarray(frame[column].to_numpy(dtype=object), dtype=str)
+    
+    def serialize_page(self, positions, start_idx):
+        """페이지 행 위치 배열을 목록 API 레코드로 일괄 변환 (iterrows 미사용)"""
+        if not len(positions):
+            return []
+        
+        page = self.df_all.iloc[positions]
+        
+        columns = {field: self._column_as_str(page, column) for field, column in LIST_FIELD_COLUMNS.items()}
+        
+        # 사업내용 요약: 고정 길이 유니코드 배열로 잘라낸 뒤 말줄임표 추가
+        content = columns['content']
+        preview = content.astype(f'<U{CONTENT_PREVIEW_LENGTH}')
+        columns['content'] = np.where(
+            np.char.str_len(content) > CONTENT_PREVIEW_LENGTH,
+            np.char.add(preview, '...'),
+            content
+        )
+        
+        if '우선순위' in page.columns:
+            columns['priority'] = page['우선순위'].to_numpy()
+        
+        if '경북관련도점수' in page.columns:
+            columns['score'] = pd.to_numeric(page['경북관련도점수'], errors='coerce').fillna(0).astype(float).to_numpy()
+        else:
+            columns['score'] = np.zeros(len(page))
+        
+        columns['index'] = page.index.to_numpy()  # DataFrame의 실제 인덱스 사용
+        columns['display_index'] = np.arange(start_idx + 1, start_idx + len(page) + 1)  # 화면 표시용 순번
+        
+        fields = list(columns.keys())
+        values = [columns[field].tolist() for field in fields]
+        return [dict(zip(fields, record)) for record in zip(*values)]
+    
+    def get_report_generator(self):
+        """워커당 하나의 검토의견서 생성기 반환 (df_all 공유, 데이터 세대가 바뀌면 재생성)
+
+        생성기는 생성 후 읽기 전용으로만 사용되므로 여러 요청에서 동시에 사용해도 안전하다.
+        """
+        cached = self._report_generator
+        if cached is not None and cached[0] == self.generation:
+            return cached[1]
+        
+        with self._report_generator_lock:
+            cached = self._report_generator
+            if cached is None or cached[0] != self.generation:
+                generator = GyeongbukResearchInstituteReportGenerator(df_projects=self.df_all)
+                cached = (self.generation, generator)
+                self._report_generator = cached
+        return cached[1]
     
     def get_project_detail(self, index):
         """프로젝트 상세 정보 반환"""
@@ -140,11 +1379,15 @@ class GyeongbukProjectManager:
                 'type': str(project.get('사업유형', '')),
                 'region': str(project.get('지역관련성', '')),
                 'score': float(project.get('경북관련도점수', 0)) if project.get('경북관련도점수') else 0,
+                'priority': int(project.get('우선순위', 0)),
                 'period': str(project.get('사업기간', '')),
                 'agency': str(project.get('시행주체', '')),
                 'matching': str(project.get('지방비매칭여부', '')),
-                'source': str(project.get('출처파일', ''))
+                'source': str(self.project_value(index, '출처파일'))
             }
+        except ColdColumnStoreError:
+            # 디스크 보관 컬럼 오류는 '없는 사업'(404)이 아니라 서버 오류로 응답
+            raise
         except Exception as e:
             print(f"프로젝트 상세 정보 조회 오류 (index: {index}): {e}")
             import traceback
@@ -154,24 +1397,238 @@ class GyeongbukProjectManager:
 # 전역 매니저 인스턴스
 project_manager = GyeongbukProjectManager()
 
+# 시작 시간 내역 (import / 데이터 로드 / 인덱스 구축)
+STARTUP_TIMINGS = {
+    'imports_seconds': round(_IMPORTS_SECONDS, 4),
+    **project_manager.startup_timings,
+    'data_source': project_manager.load_stats['source'],
+    'total_seconds': round(time.perf_counter() - _STARTUP_STARTED, 4)
+}
+print(
+    f"시작 시간: 전체 {STARTUP_TIMINGS['total_seconds']:.3f}초 "
+    f"(import {STARTUP_TIMINGS['imports_seconds']:.3f}초, "
+    f"데이터 로드 {STARTUP_TIMINGS['data_load_seconds']:.3f}초, "
+    f"인덱스 구축 {STARTUP_TIMINGS['index_build_seconds']:.3f}초)"
+)
+
+def current_manager():
+    """요청에서 사용할 매니저 (요청 처리 중에는 처음 조회한 세대를 끝까지 사용)"""
+    if has_request_context():
+        if 'project_manager' not in g:
+            g.project_manager = project_manager
+        return g.project_manager
+    return project_manager
+
+class DatasetReloader:
+    """데이터셋 핫 리로드
+
+    새 매니저(데이터·인덱스·필터 옵션)를 따로 구축한 뒤 전역 참조를 한 번에 교체한다.
+    처리 중인 요청은 이전 매니저로 끝나고(이전 세대의 디스크 보관 컬럼은 열어 둔 파일로
+    계속 읽힘), 필터 결과 캐시는 세대 번호가 바뀌어 이전 결과가 자연히 무효화된다. 감시 스레드는 데이터 파일과 재로드 요청 표시
+    파일의 수정 시각을 확인하므로 다른 워커의 재로드 요청도 따라간다. 데이터 파일
+    감시를 끈 경우(DATA_RELOAD_INTERVAL=0)에도 표시 파일만은 확인하여, 재로드 API가
+    모든 워커에 반영되고 preload 이후 새로 fork된 워커도 최신 데이터로 맞춘다.
+    """
+    
+    # 파일이 쓰이는 도중 재로드하지 않도록 마지막 수정 후 대기할 시간(초)
+    SETTLE_SECONDS = 1.0
+    
+    def __init__(self, marker_path, interval=DATA_RELOAD_INTERVAL, marker_interval=RELOAD_MARKER_INTERVAL):
+        self.marker_path = marker_path
+        self.interval = interval
+        self.marker_interval = marker_interval
+        self.loaded_signature = self.source_signature()
+        self.last_reload = None
+        self._lock = threading.Lock()
+        self._watcher = None
+    
+    def source_signature(self):
+        """데이터 CSV·스냅샷·재로드 요청 표시 파일의 수정 시각"""
+        signature = []
+        for path in (DATA_CSV, default_snapshot_path(DATA_CSV), self.marker_path):
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def request_reload(self):
+        """다른 워커의 감시 스레드가 재로드하도록 표시 파일 갱신"""
+        try:
+            os.makedirs(os.path.dirname(self.marker_path), exist_ok=True)
+            with open(self.marker_path, 'a'):
+                pass
+            os.utime(self.marker_path)
+        except OSError as e:
+            print(f"재로드 요청 표시 오류: {e}")
+    
+    def reload(self, reason='manual', broadcast=False):
+        """새 매니저를 구축하여 교체, 재로드 결과 반환 (로드 실패 시 기존 데이터 유지)
+
+        broadcast가 True이면 표시 파일을 갱신하여 다른 워커도 재로드하게 한다.
+        """
+        global project_manager
+        
+        with self._lock:
+            started = time.perf_counter()
+            signature = self.source_signature()
+            previous = project_manager
+            candidate = GyeongbukProjectManager(generation=previous.generation, query_cache=previous.query_cache)
+            
+            if candidate.df_all.empty and not previous.df_all.empty:
+                self.last_reload = {
+                    'success': False,
+                    'reason': reason,
+                    'generation': previous.generation,
+                    'error': '새 데이터를 불러오지 못해 기존 데이터를 유지합니다.',
+                    'at': datetime.now().isoformat(timespec='seconds')
+                }
+                return self.last_reload
+            
+            project_manager = candidate
+            if broadcast:
+                self.request_reload()
+                # 이 워커는 이미 반영했으므로 표시 파일 시각만 갱신 (구축 중 바뀐 데이터 파일은 다음 확인 때 반영)
+                signature = signature[:-1] + self.source_signature()[-1:]
+            self.loaded_signature = signature
+            self.last_reload = {
+                'success': True,
+                'reason': reason,
+                'generation': candidate.generation,
+                'data_version': candidate.data_version,
+                'changed': candidate.data_version != previous.data_version,
+                'total_projects': len(candidate.df_all),
+                'seconds': round(time.perf_counter() - started, 4),
+                'at': datetime.now().isoformat(timespec='seconds')
+            }
+            print(
+                f"데이터 재로드 ({reason}): 세대 {previous.generation} -> {candidate.generation}, "
+                f"{len(candidate.df_all)}개 사업 ({self.last_reload['seconds']:.3f}초)"
+            )
+            return self.last_reload
+    
+    def check(self, marker_only=False):
+        """파일이 바뀌었고 쓰기가 끝난 것으로 보이면 재로드
+
+        marker_only가 True이면 재로드 요청 표시 파일만 비교한다 (데이터 파일 자동 감시 꺼짐).
+        """
+        signature = self.source_signature()
+        compared = slice(-1, None) if marker_only else slice(None)
+        if signature[compared] == self.loaded_signature[compared]:
+            return None
+        if marker_only:
+            return self.reload(reason='broadcast')
+        newest = max((mtime for mtime in signature if mtime is not None), default=0)
+        if time.time() - newest / 1e9 < self.SETTLE_SECONDS:
+            return None
+        return self.reload(reason='watcher')
+    
+    def start_watcher(self):
+        """감시 스레드 시작
+
+        DATA_RELOAD_INTERVAL 주기로 데이터 파일과 표시 파일을 확인하고, 0이면
+        RELOAD_MARKER_INTERVAL 주기로 표시 파일만 확인한다 (둘 다 0이면 시작하지 않음).
+        """
+        marker_only = self.interval <= 0
+        interval = self.marker_interval if marker_only else self.interval
+        if interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        
+        def watch():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.check(marker_only=marker_only)
+                except Exception as e:
+                    print(f"데이터 변경 감시 오류: {e}")
+        
+        self._watcher = threading.Thread(target=watch, name='dataset-watcher', daemon=True)
+        self._watcher.start()
+
+dataset_reloader = DatasetReloader(os.path.join(REPORT_TEMP_DIR, '.reload_requested'))
+# gunicorn preload 시에는 마스터에 스레드를 두지 않고 post_fork 훅에서 워커별로 시작
+if os.environ.get('GUNICORN_PRELOAD') != '1':
+    dataset_reloader.start_watcher()
+
 @app.route('/')
 def index():
     """메인 페이지"""
     return render_template('index.html')
 
+def conditional_json(name, build_payload):
+    """데이터 버전 기반 ETag/Last-Modified 응답 (변경이 없으면 본문 없이 304)"""
+    manager = current_manager()
+    etag = f'{name}-{manager.data_version}'
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(build_payload())
+    
+    response.set_etag(etag, weak=True)
+    if manager.data_modified_at is not None:
+        response.last_modified = manager.data_modified_at
+    response.cache_control.no_cache = True  # 매번 재검증
+    return response
+
 @app.route('/api/statistics')
 def get_statistics():
     """통계 정보 API"""
-    return jsonify(project_manager.get_statistics())
+    return conditional_json('statistics', current_manager().get_statistics)
 
 @app.route('/api/filters')
 def get_filters():
     """필터 옵션 API"""
-    return jsonify(project_manager.filter_options)
+    return conditional_json('filters', lambda: current_manager().filter_options)
 
-@app.route('/api/projects')
-def get_projects():
-    """프로젝트 목록 API"""
+@app.route('/api/startup_stats')
+def get_startup_stats():
+    """워커 시작 시간 내역 API"""
+    return jsonify({
+        **STARTUP_TIMINGS,
+        'memory': current_manager().memory_stats,
+        'worker': {
+            'pid': os.getpid(),
+            'rss_bytes': process_rss_bytes(),
+            'pss_bytes': process_pss_bytes()
+        }
+    })
+
+@app.route('/api/cache_stats')
+def get_cache_stats():
+    """필터 결과 / 검토의견서 캐시 통계 API"""
+    manager = current_manager()
+    return jsonify({
+        'generation': manager.generation,
+        'query_cache': manager.query_cache.stats(),
+        'report_cache': report_cache.stats(),
+        'report_store': report_store.last_sweep_stats
+    })
+
+@app.route('/api/admin/reload', methods=['GET', 'POST'])
+def admin_reload():
+    """데이터 재로드 API (POST: 재로드 실행, GET: 마지막 재로드 결과)
+
+    X-Admin-Token 헤더가 ADMIN_TOKEN 환경 변수와 같아야 하며, 요청을 받은 워커는
+    바로 재로드하고 다른 워커는 감시 스레드가 표시 파일을 보고 따라간다
+    (RELOAD_MARKER_INTERVAL 이내, 응답의 generation은 이 워커 기준).
+    """
+    if not ADMIN_TOKEN:
+        return jsonify({'error': 'ADMIN_TOKEN이 설정되지 않아 재로드 API를 사용할 수 없습니다.'}), 403
+    if not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), ADMIN_TOKEN):
+        return jsonify({'error': '관리자 토큰이 올바르지 않습니다.'}), 403
+    
+    if request.method == 'GET':
+        return jsonify({
+            'generation': project_manager.generation,
+            'data_version': project_manager.data_version,
+            'last_reload': dataset_reloader.last_reload
+        })
+    
+    result = dataset_reloader.reload(reason='admin', broadcast=True)
+    return jsonify(result), (200 if result['success'] else 500)
+
+def request_filters():
+    """쿼리 문자열에서 목록/패싯 API 공통 필터 조건 추출"""
     filters = {
         'department': request.args.get('department'),
         'grade': request.args.get('grade'),
@@ -179,56 +1636,286 @@ def get_projects():
         'region': request.args.get('region'),
         'search': request.args.get('search'),
         'min_score': request.args.get('min_score', type=int),
-        'max_score': request.args.get('max_score', type=int)
+        'max_score': request.args.get('max_score', type=int),
+        'min_budget': request.args.get('min_budget', type=float),
+        'max_budget': request.args.get('max_budget', type=float),
+        'min_priority': request.args.get('min_priority', type=int),
+        'max_priority': request.args.get('max_priority', type=int),
+        'sort': request.args.get('sort')
     }
     
     # None 값 제거
     filters = {k: v for k, v in filters.items() if v is not None and v != ''}
+    return filters
+
+@app.route('/api/projects')
+def get_projects():
+    """프로젝트 목록 API"""
+    filters = request_filters()
     
-    df_filtered = project_manager.filter_projects(filters)
-    
-    # 페이징
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 50, type=int)
+    manager = current_manager()
+    positions = manager.filter_positions(filters)
+    sort = dict(manager.normalize_filters(filters)).get('sort')
     
-    start_idx = (page - 1) * per_page
+    # 페이징: cursor가 있으면 키셋 방식, 없으면 page 번호(오프셋) 방식
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), MAX_PER_PAGE)
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            start_idx = manager.seek_cursor(positions, sort, cursor)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        page = start_idx // per_page + 1
+    else:
+        page = max(request.args.get('page', 1, type=int), 1)
+        start_idx = (page - 1) * per_page
     end_idx = start_idx + per_page
     
-    projects = []
-    for i, (idx, row) in enumerate(df_filtered.iloc[start_idx:end_idx].iterrows()):
-        projects.append({
-            'index': idx,  # DataFrame의 실제 인덱스 사용
-            'display_index': start_idx + i + 1,  # 화면 표시용 순번
-            'name': str(row.get('단위사업명', '')),
-            'department': str(row.get('주요부처', '')),
-            'content': str(row.get('사업내용', ''))[:100] + '...' if len(str(row.get('사업내용', ''))) > 100 else str(row.get('사업내용', '')),
-            'budget': str(row.get('사업비', '')),
-            'grade': str(row.get('경북관련성_최종', '')),
-            'score': float(row.get('경북관련도점수', 0)) if row.get('경북관련도점수') else 0,
-            'type': str(row.get('사업유형', '')),
-            'region': str(row.get('지역관련성', ''))
-        })
+    page_positions = positions[start_idx:end_idx]
+    projects = manager.serialize_page(page_positions, start_idx)
+    
+    next_cursor = None
+    if end_idx < len(positions) and len(page_positions):
+        next_cursor = manager.encode_cursor(sort, page_positions[-1])
     
     return jsonify({
         'projects': projects,
-        'total': len(df_filtered),
+        'total': len(positions),
         'page': page,
         'per_page': per_page,
-        'total_pages': (len(df_filtered) + per_page - 1) // per_page
+        'total_pages': (len(positions) + per_page - 1) // per_page,
+        'sort': sort,
+        'next_cursor': next_cursor
     })
 
+@app.route('/api/facets')
+def get_facets():
+    """현재 필터 조건의 범주별 건수/사업비 합계 API"""
+    return jsonify(current_manager().get_facets(request_filters()))
+
+@app.errorhandler(ColdColumnStoreError)
+def cold_column_store_error(e):
+    """디스크 보관 컬럼을 읽지 못한 요청은 빈 값 대신 500 응답"""
+    print(f"디스크 보관 컬럼 오류: {e}")
+    return jsonify({'error': f'원본 컬럼을 읽지 못했습니다: {e}'}), 500
+
 @app.route('/api/project/<int:index>')
 def get_project_detail(index):
     """프로젝트 상세 정보 API"""
-    detail = project_manager.get_project_detail(index)
+    detail = current_manager().get_project_detail(index)
     if detail:
         return jsonify(detail)
     else:
         return jsonify({'error': '프로젝트를 찾을 수 없습니다.'}), 404
 
+def render_report_file(project_index, manager=None):
+    """단일 사업 검토의견서 생성 후 저장소에 저장, 파일 정보 반환
+
+    manager를 지정하면 해당 세대의 데이터로 생성 (백그라운드 작업용)
+    """
+    manager = manager or current_manager()
+    
+    # 워커 공용 검토의견서 생성기 (df_all 공유)
+    generator = manager.get_report_generator()
+    
+    row = manager.df_all.iloc[project_index]
+    
+    # 같은 내용의 행은 렌더링 없이 캐시된 본문에 검토일자만 채워 사용
+    cache_key = (int(manager.row_hashes[project_index]), generator.TEMPLATE_VERSION)
+    cached = report_cache.get(cache_key)
+    if cached is None:
+        cached = generator.build_report(row, current_date=generator.DATE_PLACEHOLDER)
+        report_cache.put(cache_key, cached)
+    filename, report_template, priority = cached
+    report_content = report_template.replace(generator.DATE_PLACEHOLDER, generator.format_review_date())
+    
+    file_id, temp_path = report_store.save(filename, report_content)
+    
+    return {
+        'index': int(project_index),
+        'file_id': file_id,
+        'filename': filename,
+        'path': temp_path,
+        'project_name': str(row.get('단위사업명', '')),
+        'priority': int(priority)
+    }
+
+report_cache = ReportCache()
+report_store = ReportStore(REPORT_TEMP_DIR)
+
+def process_exists(pid):
+    """같은 호스트에 해당 PID의 프로세스가 있는지 (POSIX 외에는 확인하지 않고 True)"""
+    if os.name != 'posix':
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # 권한 없음 등: 프로세스는 존재
+        return True
+    return True
+
+class ReportJobManager:
+    """검토의견서 생성 작업 큐
+
+    제출된 사업은 스레드 풀에서 하나씩 렌더링되며, 작업 상태는 메모리와 함께
+    JSON 파일로도 저장되어 다른 gunicorn 워커에서도 진행 상황을 조회할 수 있다.
+    작업은 등록한 워커에서만 처리되므로 파일에 처리 워커 PID와 갱신 시각을 기록하고,
+    진행 중인 작업은 주기적으로 갱신한다. 처리 워커가 종료되었거나(재시작·max_requests)
+    갱신이 끊긴 작업은 조회 시 'failed'로 응답한다.
+    """
+    
+    def __init__(self, job_dir, max_workers=REPORT_JOB_WORKERS, max_jobs=MAX_REPORT_JOBS):
+        self.job_dir = job_dir
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report-job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._heartbeat = None
+    
+    def submit(self, project_indexes, manager):
+        """작업 등록 후 작업 상태 반환 (인덱스는 manager 세대 기준으로 렌더링)"""
+        job_id = uuid.uuid4().hex
+        job = {
+            'job_id': job_id,
+            'status': 'queued',
+            'total': len(project_indexes),
+            'completed': 0,
+            'failed': 0,
+            'files': [],
+            'errors': [],
+            'error': None,
+            'owner_pid': os.getpid(),
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'updated_at': None,
+            'finished_at': None
+        }
+        
+        with self._lock:
+            self._jobs[job_id] = job
+            self._evict_finished()
+            self._save(job)
+            snapshot = self._status(job)
+            self._start_heartbeat()
+        
+        for project_index in project_indexes:
+            self._executor.submit(self._render, job_id, project_index, manager)
+        return snapshot
+    
+    def get(self, job_id):
+        """작업 상태 반환 (다른 워커가 등록한 작업은 저장된 파일에서 조회)"""
+        if not re.fullmatch(r'[0-9a-f]{32}', job_id):
+            return None
+        
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return self._status(job)
+        
+        try:
+            with open(self._job_path(job_id), encoding='utf-8') as f:
+                job = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return self._status(self._check_orphaned(job))
+    
+    def _check_orphaned(self, job):
+        """다른 프로세스가 등록한 진행 중 작업의 처리 워커가 사라졌거나 갱신이 끊겼으면 실패 상태로 반환"""
+        if job['status'] not in ('queued', 'running'):
+            return job
+        
+        owner_pid = job.get('owner_pid')
+        updated_at = job.get('updated_at') or job.get('created_at')
+        error = None
+        # 같은 PID인데 메모리에 없으면 PID를 재사용한 새 프로세스 (원래 처리 워커는 종료됨)
+        if owner_pid is not None and (owner_pid == os.getpid() or not process_exists(owner_pid)):
+            error = '작업을 처리하던 서버 프로세스가 종료되어 작업이 중단되었습니다. 다시 생성해 주세요.'
+        elif updated_at and (datetime.now() - datetime.fromisoformat(updated_at)).total_seconds() > REPORT_JOB_STALE_SECONDS:
+            error = '작업 상태가 오랫동안 갱신되지 않아 중단된 것으로 처리했습니다. 다시 생성해 주세요.'
+        
+        if error is None:
+            return job
+        return dict(job, status='failed', error=error)
+    
+    def _start_heartbeat(self):
+        # 대기 중인 작업도 갱신 시각이 끊기지 않도록 진행 중인 작업 상태 파일을 주기적으로 다시 저장
+        if self._heartbeat is not None and self._heartbeat.is_alive():
+            return
+        
+        def beat():
+            while True:
+                time.sleep(REPORT_JOB_HEARTBEAT_SECONDS)
+                with self._lock:
+                    for job in self._jobs.values():
+                        if job['status'] in ('queued', 'running'):
+                            self._save(job)
+        
+        self._heartbeat = threading.Thread(target=beat, name='report-job-heartbeat', daemon=True)
+        self._heartbeat.start()
+    
+    def _render(self, job_id, project_index, manager):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job['status'] = 'running'
+        
+        try:
+            file_info = render_report_file(project_index, manager)
+            error = None
+        except Exception as e:
+            print(f"프로젝트 {project_index} 검토의견서 생성 오류: {e}")
+            file_info = None
+            error = {'index': project_index, 'error': str(e)}
+        
+        with self._lock:
+            if file_info is not None:
+                job['files'].append(file_info)
+                job['completed'] += 1
+            else:
+                job['errors'].append(error)
+                job['failed'] += 1
+            
+            if job['completed'] + job['failed'] >= job['total']:
+                job['status'] = 'completed'
+                job['finished_at'] = datetime.now().isoformat(timespec='seconds')
+            self._save(job)
+    
+    def _status(self, job):
+        status = dict(job, files=list(job['files']), errors=list(job['errors']))
+        done = job['completed'] + job['failed']
+        status['progress'] = round(done / job['total'] * 100, 1) if job['total'] else 100.0
+        return status
+    
+    def _job_path(self, job_id):
+        return os.path.join(self.job_dir, f'{job_id}.json')
+    
+    def _save(self, job):
+        # 임시 파일에 쓴 뒤 교체하여 다른 워커가 불완전한 파일을 읽지 않도록 함
+        job['updated_at'] = datetime.now().isoformat(timespec='seconds')
+        try:
+            os.makedirs(self.job_dir, exist_ok=True)
+            temp_path = f'{self._job_path(job["job_id"])}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(job, f, ensure_ascii=False)
+            os.replace(temp_path, self._job_path(job['job_id']))
+        except OSError as e:
+            print(f"작업 상태 저장 오류 ({job['job_id']}): {e}")
+    
+    def _evict_finished(self):
+        # 메모리에 유지하는 작업 수 제한 (완료된 오래된 작업부터 제거)
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_jobs:
+                break
+            if self._jobs[job_id]['status'] == 'completed':
+                del self._jobs[job_id]
+
+report_jobs = ReportJobManager(report_store.job_dir)
+
 @app.route('/api/generate_report', methods=['POST'])
 def generate_report():
-    """검토의견서 PDF 생성 API"""
+    """검토의견서 생성 API (동기 처리, 소량 선택용)"""
     try:
         data = request.get_json()
         selected_projects = data.get('projects', [])
@@ -236,38 +1923,11 @@ def generate_report():
         if not selected_projects:
             return jsonify({'error': '선택된 프로젝트가 없습니다.'}), 400
         
-        # Python 검토의견서 생성기 실행
-        import sys
-        sys.path.append('.')
-        from 경북연구원_검토의견서_생성기 import GyeongbukResearchInstituteReportGenerator
-        
-        generator = GyeongbukResearchInstituteReportGenerator()
-        
         # 선택된 프로젝트들에 대해 검토의견서 생성
         generated_files = []
         for project_index in selected_projects:
             try:
-                row = project_manager.df_all.iloc[project_index]
-                priority = generator.calculate_priority_percentage(row)
-                main_keyword = generator.extract_keywords(row['단위사업명'])
-                report_content = generator.generate_comprehensive_report(row, priority)
-                filename = generator.generate_filename(row, priority, main_keyword)
-                
-                # 임시 파일로 저장 (Vercel에서는 /tmp 사용)
-                temp_dir = '/tmp/temp_reports' if os.path.exists('/tmp') else 'temp_reports'
-                temp_path = os.path.join(temp_dir, filename)
-                os.makedirs(temp_dir, exist_ok=True)
-                
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    f.write(report_content)
-                
-                generated_files.append({
-                    'filename': filename,
-                    'path': temp_path,
-                    'project_name': row.get('단위사업명', ''),
-                    'priority': priority
-                })
-                
+                generated_files.append(render_report_file(project_index))
             except Exception as e:
                 print(f"프로젝트 {project_index} 검토의견서 생성 오류: {e}")
                 continue
@@ -282,51 +1942,190 @@ def generate_report():
         print(f"검토의견서 생성 오류: {e}")
         return jsonify({'error': f'검토의견서 생성 중 오류가 발생했습니다: {str(e)}'}), 500
 
+@app.route('/api/report_jobs', methods=['POST'])
+def submit_report_job():
+    """검토의견서 생성 작업 등록 API (백그라운드 처리, 작업 ID 반환)"""
+    data = request.get_json(silent=True) or {}
+    selected_projects = data.get('projects', [])
+    
+    if not selected_projects:
+        return jsonify({'error': '선택된 프로젝트가 없습니다.'}), 400
+    
+    try:
+        project_indexes = [int(project_index) for project_index in selected_projects]
+    except (TypeError, ValueError):
+        return jsonify({'error': '잘못된 프로젝트 인덱스가 포함되어 있습니다.'}), 400
+    
+    return jsonify(report_jobs.submit(project_indexes, current_manager())), 202
+
+@app.route('/api/report_jobs/<job_id>')
+def get_report_job(job_id):
+    """검토의견서 생성 작업 진행 상황 API"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    return jsonify(job)
+
+class _ZipStreamBuffer:
+    """zipfile 출력용 쓰기 전용 버퍼 (쓴 내용을 바로 꺼내 스트리밍)"""
+    
+    def __init__(self):
+        self._chunks = []
+    
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def pop(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def stream_report_zip(files, chunk_size=64 * 1024):
+    """검토의견서 파일들을 ZIP으로 압축하며 조각 단위로 반환 (전체 압축 파일을 메모리나 디스크에 만들지 않음)"""
+    buffer = _ZipStreamBuffer()
+    used_names = set()
+    with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for file_info in files:
+            resolved = report_store.resolve(file_info.get('file_id'))
+            if resolved is None or resolved[0] in used_names:
+                continue
+            filename, file_path = resolved
+            used_names.add(filename)
+            
+            with open(file_path, 'rb') as source, archive.open(filename, mode='w') as target:
+                for chunk in iter(lambda: source.read(chunk_size), b''):
+                    target.write(chunk)
+                    data = buffer.pop()
+                    if data:
+                        yield data
+            
+            data = buffer.pop()
+            if data:
+                yield data
+    
+    # 중앙 디렉터리
+    yield buffer.pop()
+
+@app.route('/api/report_jobs/<job_id>/zip')
+def download_report_job_zip(job_id):
+    """작업의 모든 검토의견서를 하나의 ZIP으로 스트리밍 다운로드"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': '작업을 찾을 수 없습니다.'}), 404
+    if job['status'] == 'failed':
+        return jsonify({'error': job['error']}), 409
+    if job['status'] != 'completed':
+        return jsonify({'error': '검토의견서 생성이 아직 진행 중입니다.'}), 409
+    
+    return Response(
+        stream_with_context(stream_report_zip(job['files'])),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename=reports_{job_id}.zip'}
+    )
+
+@app.route('/api/reports/<file_id>')
+def download_report_file(file_id):
+    """검토의견서 파일 다운로드 (파일 ID)"""
+    resolved = report_store.resolve(file_id)
+    if resolved is None:
+        return "파일을 찾을 수 없습니다.", 404
+    filename, file_path = resolved
+    return send_file(file_path, as_attachment=True, download_name=filename)
+
 @app.route('/download_report/<filename>')
 def download_report(filename):
-    """검토의견서 파일 다운로드"""
+    """검토의견서 파일 다운로드 (파일명, 가장 최근 생성한 같은 이름의 파일)"""
     try:
-        # Vercel 환경에 맞는 경로 설정
-        temp_dir = '/tmp/temp_reports' if os.path.exists('/tmp') else 'temp_reports'
-        file_path = os.path.join(temp_dir, filename)
+        resolved = report_store.resolve_name(filename)
         
-        if os.path.exists(file_path):
-            return send_file(file_path, as_attachment=True, download_name=filename)
+        if resolved is not None:
+            return send_file(resolved[1], as_attachment=True, download_name=filename)
         else:
             return "파일을 찾을 수 없습니다.", 404
     except Exception as e:
         return f"다운로드 오류: {str(e)}", 500
 
+def iter_export_chunks(positions, columns):
+    """내보낼 행을 EXPORT_CHUNK_ROWS 단위 DataFrame 조각으로 반환"""
+    for start in range(0, len(positions), EXPORT_CHUNK_ROWS):
+        yield current_manager().project_frame(positions[start:start + EXPORT_CHUNK_ROWS], columns)
+
+def write_xlsx_export(positions, columns, output):
+    """openpyxl write-only 모드로 행을 조각 단위로 기록 (셀 객체를 메모리에 유지하지 않음)"""
+    from openpyxl import Workbook
+    
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('경북관련사업')
+    sheet.append(columns)
+    for chunk in iter_export_chunks(positions, columns):
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        for values in chunk.itertuples(index=False, name=None):
+            sheet.append(values)
+    workbook.save(output)
+
+def stream_delimited_export(positions, columns, sep):
+    """CSV/TSV 내보내기: 헤더와 행 조각을 생성되는 대로 반환 (엑셀 호환 UTF-8 BOM 포함)"""
+    yield '\ufeff' + pd.DataFrame(columns=columns).to_csv(index=False, sep=sep)
+    for chunk in iter_export_chunks(positions, columns):
+        yield chunk.to_csv(index=False, header=False, sep=sep)
+
+def attachment_header(filename):
+    """한글 파일명을 포함한 Content-Disposition 헤더 값"""
+    return f"attachment; filename*=UTF-8''{quote(filename)}"
+
+@app.route('/api/export', methods=['POST'])
 @app.route('/api/export_excel', methods=['POST'])
 def export_excel():
-    """엑셀 내보내기 API"""
+    """내보내기 API
+
+    요청 본문:
+        filters: 목록 API와 같은 필터 조건
+        format: 'xlsx'(기본) / 'csv' / 'tsv'
+        columns: 'basic'(기본, 주요 컬럼) / 'all'(경비내역 등 원본 CSV 전체 컬럼)
+    """
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         filters = data.get('filters', {})
+        export_format = data.get('format', 'xlsx')
         
-        df_filtered = project_manager.filter_projects(filters)
+        if export_format not in ('xlsx', 'csv', 'tsv'):
+            return jsonify({'error': f'지원하지 않는 형식입니다: {export_format}'}), 400
         
-        # 엑셀 파일 생성
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            # 주요 컬럼만 선택
-            export_columns = [
-                '단위사업명', '주요부처', '사업내용', '사업비', 
-                '경북관련성_최종', '경북관련도점수', '사업유형', 
-                '지역관련성', '사업기간', '시행주체'
-            ]
-            
-            # 존재하는 컬럼만 선택
-            available_columns = [col for col in export_columns if col in df_filtered.columns]
-            df_export = df_filtered[available_columns]
-            
-            df_export.to_excel(writer, sheet_name='경북관련사업', index=False)
+        manager = current_manager()
+        positions = manager.filter_positions(filters)
         
-        output.seek(0)
+        # 존재하는 컬럼만 선택
+        export_columns = manager.source_columns if data.get('columns') == 'all' else EXPORT_COLUMNS
+        available_columns = [col for col in export_columns if manager.has_column(col)]
         
         # 파일명 생성
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'경북관련사업_{timestamp}.xlsx'
+        filename = f'경북관련사업_{timestamp}.{export_format}'
+        
+        if export_format in ('csv', 'tsv'):
+            sep = ',' if export_format == 'csv' else '\t'
+            mimetype = 'text/csv' if export_format == 'csv' else 'text/tab-separated-values'
+            # 헤더와 첫 행 조각을 미리 만들어 디스크 보관 컬럼 읽기 오류는 스트리밍 전에 500으로 응답
+            body = stream_delimited_export(positions, available_columns, sep)
+            head = [next(body), next(body, '')]
+            return Response(
+                stream_with_context(itertools.chain(head, body)),
+                mimetype=f'{mimetype}; charset=utf-8',
+                headers={'Content-Disposition': attachment_header(filename)}
+            )
+        
+        # 엑셀 파일은 이름 없는 임시 파일에 기록 후 전송 (응답이 파일을 닫으면 자동 삭제)
+        output = tempfile.TemporaryFile(suffix='.xlsx')
+        try:
+            write_xlsx_export(positions, available_columns, output)
+        except Exception:
+            output.close()
+            raise
+        output.seek(0)
         
         return send_file(
             output,
@@ -339,10 +2138,78 @@ def export_excel():
         print(f"엑셀 내보내기 오류: {e}")
         return jsonify({'error': f'엑셀 내보내기 중 오류가 발생했습니다: {str(e)}'}), 500
 
+@app.url_defaults
+def add_static_version(endpoint, values):
+    """정적 파일 URL에 수정 시각 버전 추가 (파일이 바뀌면 브라우저 캐시 무효화)"""
+    if endpoint != 'static' or 'filename' not in values or 'v' in values:
+        return
+    try:
+        values['v'] = int(os.path.getmtime(os.path.join(app.static_folder, values['filename'])))
+    except OSError:
+        pass
+
+# 압축된 정적 파일 본문 캐시 (ETag, 인코딩) -> 본문
+_compressed_static = OrderedDict()
+_compressed_static_lock = threading.Lock()
+
+def choose_encoding():
+    """Accept-Encoding 헤더 기준 응답 인코딩 선택 (br > gzip)"""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return None
+
+@app.after_request
+def compress_response(response):
+    """JSON/정적 응답 gzip·brotli 압축"""
+    if (
+        response.status_code != 200
+        or response.is_streamed and not response.direct_passthrough
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        or 'Content-Encoding' in response.headers
+    ):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding()
+    if encoding is None:
+        return response
+    
+    # 정적 파일(send_file)은 본문을 직접 읽어 압축
+    is_static = response.direct_passthrough
+    response.direct_passthrough = False
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_BYTES:
+        return response
+    
+    etag, _ = response.get_etag()
+    cache_key = (etag, encoding) if is_static and etag else None
+    compressed = None
+    if cache_key:
+        with _compressed_static_lock:
+            compressed = _compressed_static.get(cache_key)
+    
+    if compressed is None:
+        compressed = brotli.compress(data) if encoding == 'br' else gzip.compress(data, compresslevel=6)
+        if cache_key:
+            with _compressed_static_lock:
+                _compressed_static[cache_key] = compressed
+                while len(_compressed_static) > 64:
+                    _compressed_static.popitem(last=False)
+    
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    # 압축본은 원본과 바이트가 다르므로 약한 ETag로 표시 (재검증 시 304는 그대로 동작)
+    if etag:
+        response.set_etag(etag, weak=True)
+    return response
+
 # 필요한 디렉토리 생성 (Vercel에서는 /tmp 사용)
 def ensure_directories():
     try:
-        os.makedirs('/tmp/temp_reports', exist_ok=True)
+        os.makedirs(REPORT_TEMP_DIR, exist_ok=True)
         os.makedirs('static/css', exist_ok=True)
         os.makedirs('static/js', exist_ok=True)
         os.makedirs('templates', exist_ok=True)
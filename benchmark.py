@@ -0,0 +1,324 @@
+"""
+경북 사업 웹 시스템 엔드포인트 벤치마크
+- 실제 CSV 스키마(컬럼 구성·값 분포)를 따르는 합성 데이터를 행 수별로 생성
+- 데이터 크기마다 별도 프로세스에서 app을 로드하고 Flask 테스트 클라이언트로 엔드포인트 호출
+- 엔드포인트별 지연 시간 백분위수, 처리량, 최대 메모리를 JSON으로 저장 (커밋 간 비교용)
+
+사용법:
+    python benchmark.py                              # 700 / 1만 / 10만 / 100만 행
+    python benchmark.py --sizes 700,10000 --iterations 50
+    python benchmark.py --compare bench_results/이전.json bench_results/최신.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+TEMPLATE_CSV = '경북_관련_사업_700개_최종선별.csv'
+BENCH_DATA_DIR = 'bench_data'
+BENCH_RESULTS_DIR = 'bench_results'
+DEFAULT_SIZES = [700, 10_000, 100_000, 1_000_000]
+DEFAULT_ITERATIONS = 30
+
+# 엔드포인트별 반복 횟수 배율 (무거운 요청은 적게)
+ITERATION_SCALE = {
+    'generate_report': 0.5,
+    'export_excel_filtered': 0.2,
+    'export_csv_filtered': 0.2
+}
+
+def synthetic_csv_path(rows, seed):
+    """행 수·시드별 합성 데이터 경로"""
+    return os.path.join(BENCH_DATA_DIR, f'synthetic_{rows}_{seed}.csv')
+
+def format_money(amounts):
+    """천원 단위 정수 배열을 원본과 같은 '1,234,000천원' 문자열로 변환"""
+    return pd.Series(amounts).map('{:,}천원'.format)
+
+def generate_synthetic_csv(rows, path, seed=0, template_csv=TEMPLATE_CSV):
+    """원본 CSV와 같은 컬럼 구성의 합성 데이터 생성
+
+    컬럼마다 원본 값을 무작위로 뽑아 범주 분포를 유지하고, 사업명은 행마다
+    고유하게, 사업비는 로그정규분포 금액으로 새로 만든다.
+    """
+    template = pd.read_csv(template_csv)
+    rng = np.random.default_rng(seed)
+
+    synthetic = {}
+    for column in template.columns:
+        values = template[column].to_numpy(dtype=object)
+        synthetic[column] = values[rng.integers(0, len(values), rows)]
+    frame = pd.DataFrame(synthetic, columns=template.columns)
+
+    # 원본 숫자 컬럼 타입 유지
+    for column in template.columns:
+        if pd.api.types.is_numeric_dtype(template[column]):
+            frame[column] = frame[column].astype(template[column].dtype)
+
+    if '단위사업명' in frame.columns:
+        frame['단위사업명'] = frame['단위사업명'].astype(str) + ' ' + pd.Series(np.arange(rows)).astype(str)
+
+    # 사업비: 천원 단위, 백만원 단위로 반올림 (원본과 같은 ',000천원' 형태)
+    amounts = (np.round(rng.lognormal(mean=np.log(5_000_000), sigma=1.5, size=rows) / 1000) * 1000).astype(np.int64)
+    if '사업비' in frame.columns:
+        frame['사업비'] = format_money(amounts)
+    if '예산_숫자' in frame.columns:
+        frame['예산_숫자'] = amounts
+
+    if '경북관련도점수' in frame.columns:
+        frame['경북관련도점수'] = np.round(rng.uniform(0, 300, rows), 1)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f'{path}.tmp'
+    frame.to_csv(temp_path, index=False)
+    os.replace(temp_path, path)
+    return path
+
+def ensure_synthetic_csv(rows, seed=0):
+    """합성 데이터가 없으면 생성, 경로 반환"""
+    path = synthetic_csv_path(rows, seed)
+    if not os.path.exists(path):
+        started = time.perf_counter()
+        generate_synthetic_csv(rows, path, seed)
+        print(f"합성 데이터 생성: {path} ({time.perf_counter() - started:.1f}초)")
+    return path
+
+def peak_memory_bytes():
+    """현재 프로세스 최대 상주 메모리 (Linux는 KB, macOS는 바이트 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def summarize_latencies(latencies, elapsed):
+    """지연 시간 목록(초) -> 백분위수(ms)·처리량 요약"""
+    values = np.asarray(latencies) * 1000
+    return {
+        'count': len(values),
+        'mean_ms': round(float(values.mean()), 3),
+        'p50_ms': round(float(np.percentile(values, 50)), 3),
+        'p90_ms': round(float(np.percentile(values, 90)), 3),
+        'p99_ms': round(float(np.percentile(values, 99)), 3),
+        'max_ms': round(float(values.max()), 3),
+        'throughput_rps': round(len(values) / elapsed, 2) if elapsed > 0 else None
+    }
+
+def build_scenarios(app_module, rng):
+    """엔드포인트별 요청 함수 목록 (이름, 호출 시마다 새 요청을 만드는 함수)"""
+    manager = app_module.project_manager
+    row_count = len(manager.df_all)
+    departments = manager.filter_options['departments'] or ['']
+    grades = manager.filter_options['grades'] or ['']
+    deep_page = max(row_count // 50 // 2, 1)
+
+    def random_index():
+        return int(rng.integers(0, row_count))
+
+    return [
+        ('projects_first_page', lambda c: c.get('/api/projects?per_page=50')),
+        ('projects_deep_page', lambda c: c.get(f'/api/projects?per_page=50&page={deep_page}')),
+        ('projects_sorted', lambda c: c.get('/api/projects?per_page=50&sort=-score')),
+        ('projects_filtered', lambda c: c.get('/api/projects', query_string={
+            'department': departments[int(rng.integers(0, len(departments)))],
+            'grade': grades[int(rng.integers(0, len(grades)))],
+            'per_page': 50
+        })),
+        ('projects_search', lambda c: c.get('/api/projects', query_string={
+            'search': ['지원', '산업', '기술 개발', '안전'][int(rng.integers(0, 4))],
+            'per_page': 50
+        })),
+        ('facets', lambda c: c.get('/api/facets', query_string={
+            'grade': grades[int(rng.integers(0, len(grades)))]
+        })),
+        ('project_detail', lambda c: c.get(f'/api/project/{random_index()}')),
+        ('generate_report', lambda c: c.post('/api/generate_report', json={'projects': [random_index()]})),
+        ('export_excel_filtered', lambda c: c.post('/api/export_excel', json={
+            'format': 'xlsx',
+            'filters': {'department': departments[0], 'grade': grades[0]}
+        })),
+        ('export_csv_filtered', lambda c: c.post('/api/export', json={
+            'format': 'csv',
+            'filters': {'department': departments[0]}
+        }))
+    ]
+
+def run_worker(csv_path, iterations, seed):
+    """(하위 프로세스) 지정 데이터로 app을 로드하고 엔드포인트별 측정 결과 반환"""
+    os.environ['DATA_CSV'] = csv_path
+
+    started = time.perf_counter()
+    import app as app_module
+    startup_seconds = time.perf_counter() - started
+    startup_peak = peak_memory_bytes()
+
+    client = app_module.app.test_client()
+    rng = np.random.default_rng(seed)
+
+    endpoints = {}
+    for name, request in build_scenarios(app_module, rng):
+        count = max(int(iterations * ITERATION_SCALE.get(name, 1)), 3)
+
+        # 첫 호출(캐시 적재 전) 지연은 별도 기록
+        cold_started = time.perf_counter()
+        response = request(client)
+        response.get_data()
+        cold_ms = (time.perf_counter() - cold_started) * 1000
+        status = response.status_code
+        errors = 0
+
+        latencies = []
+        loop_started = time.perf_counter()
+        for _ in range(count):
+            request_started = time.perf_counter()
+            response = request(client)
+            response.get_data()  # 스트리밍 응답도 끝까지 소비
+            latencies.append(time.perf_counter() - request_started)
+            errors += response.status_code >= 400
+        elapsed = time.perf_counter() - loop_started
+
+        endpoints[name] = {
+            **summarize_latencies(latencies, elapsed),
+            'first_call_ms': round(cold_ms, 3),
+            'status': status,
+            'errors': errors,
+            'peak_memory_bytes': peak_memory_bytes()
+        }
+        print(f"  {name:24s} p50 {endpoints[name]['p50_ms']:9.2f}ms  p99 {endpoints[name]['p99_ms']:9.2f}ms  {endpoints[name]['throughput_rps']:8.1f} req/s")
+
+    return {
+        'rows': len(app_module.project_manager.df_all),
+        'startup_seconds': round(startup_seconds, 4),
+        'startup_timings': app_module.STARTUP_TIMINGS,
+        'startup_peak_memory_bytes': startup_peak,
+        'memory': app_module.project_manager.memory_stats,
+        'peak_memory_bytes': peak_memory_bytes(),
+        'endpoints': endpoints
+    }
+
+def git_revision():
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmark(sizes, iterations, seed, output_path=None):
+    """데이터 크기별로 하위 프로세스에서 벤치마크 실행 후 결과 JSON 저장, 결과 반환"""
+    revision = git_revision()
+    results = {
+        'revision': revision,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'iterations': iterations,
+        'seed': seed,
+        'sizes': {}
+    }
+
+    for rows in sizes:
+        csv_path = ensure_synthetic_csv(rows, seed)
+        print(f"[{rows:,}행] 측정 중...")
+
+        # 같은 호스트에서 서비스 중인 앱의 /tmp 경로(디스크 보관 컬럼·검토의견서 저장소·재로드 표시 파일)를
+        # 건드리지 않도록 하위 프로세스마다 별도 임시 폴더 사용
+        scratch_dir = tempfile.mkdtemp(prefix='gyeongbuk-bench-')
+        env = dict(
+            os.environ,
+            TMPDIR=scratch_dir,
+            REPORT_TEMP_DIR=os.path.join(scratch_dir, 'temp_reports'),
+            COLD_STORE_DIR=os.path.join(scratch_dir, 'cold_columns')
+        )
+
+        # 데이터 크기마다 새 프로세스: 최대 메모리·시작 시간이 이전 크기의 영향을 받지 않도록
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            result_path = f.name
+        try:
+            command = [
+                sys.executable, os.path.abspath(__file__), '--worker',
+                '--csv', csv_path, '--iterations', str(iterations),
+                '--seed', str(seed), '--result-file', result_path
+            ]
+            completed = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
+            for line in completed.stdout.splitlines():
+                if line.startswith('  '):
+                    print(line)
+            if completed.returncode != 0:
+                print(completed.stdout[-2000:])
+                results['sizes'][str(rows)] = {'error': f'exit code {completed.returncode}'}
+                continue
+            with open(result_path, encoding='utf-8') as f:
+                results['sizes'][str(rows)] = json.load(f)
+        finally:
+            os.remove(result_path)
+            shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    output_path = output_path or os.path.join(
+        BENCH_RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{revision or 'unknown'}.json"
+    )
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output_path}")
+    return results
+
+def compare_results(base_path, head_path):
+    """두 결과 파일의 엔드포인트별 p50/p99 변화율 출력"""
+    with open(base_path, encoding='utf-8') as f:
+        base = json.load(f)
+    with open(head_path, encoding='utf-8') as f:
+        head = json.load(f)
+
+    print(f"기준 {base.get('revision')} -> 비교 {head.get('revision')}")
+    for rows, head_size in head['sizes'].items():
+        base_size = base['sizes'].get(rows)
+        if not base_size or 'endpoints' not in base_size or 'endpoints' not in head_size:
+            continue
+        print(f"[{int(rows):,}행] 최대 메모리 {base_size['peak_memory_bytes'] / 1e6:.0f}MB -> {head_size['peak_memory_bytes'] / 1e6:.0f}MB")
+        for name, head_stats in head_size['endpoints'].items():
+            base_stats = base_size['endpoints'].get(name)
+            if not base_stats:
+                continue
+            changes = []
+            for key in ('p50_ms', 'p99_ms'):
+                ratio = head_stats[key] / base_stats[key] - 1 if base_stats[key] else 0
+                changes.append(f"{key[:3]} {base_stats[key]:.2f} -> {head_stats[key]:.2f}ms ({ratio:+.0%})")
+            print(f"  {name:24s} " + ', '.join(changes))
+
+def main():
+    parser = argparse.ArgumentParser(description='경북 사업 웹 시스템 엔드포인트 벤치마크')
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='데이터 행 수 목록 (쉼표 구분)')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help='엔드포인트별 반복 횟수')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터·요청 난수 시드')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: bench_results/<시각>_<커밋>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'HEAD'), help='두 결과 JSON 비교')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--csv', help=argparse.SUPPRESS)
+    parser.add_argument('--result-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare_results(*args.compare)
+        return
+
+    if args.worker:
+        result = run_worker(args.csv, args.iterations, args.seed)
+        with open(args.result_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        return
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    run_benchmark(sizes, args.iterations, args.seed, args.output)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+경북 사업 데이터 바이너리 스냅샷
+- CSV를 pandas로 한 번 파싱한 결과(컬럼 타입 포함)를 pickle로 저장
+- 콜드 스타트 시 CSV 파싱 대신 스냅샷 로드
+- 원본 CSV보다 오래되었고 내용 해시도 다르면 사용하지 않음
+
+사용법: python data_snapshot.py [CSV 경로] [스냅샷 경로]
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import time
+
+import pandas as pd
+
+# 스냅샷 구조가 바뀌면 증가 (이전 형식 스냅샷은 무시)
+SNAPSHOT_FORMAT_VERSION = 1
+
+def default_snapshot_path(csv_path):
+    """CSV 경로에 대응하는 기본 스냅샷 경로"""
+    return os.path.splitext(csv_path)[0] + '.snapshot.pkl'
+
+def file_sha256(path):
+    """파일 내용 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_snapshot(csv_path, snapshot_path=None):
+    """CSV를 파싱하여 스냅샷 파일로 저장, 저장 경로 반환"""
+    snapshot_path = snapshot_path or default_snapshot_path(csv_path)
+    frame = pd.read_csv(csv_path)
+    payload = {
+        'format_version': SNAPSHOT_FORMAT_VERSION,
+        'source_sha256': file_sha256(csv_path),
+        'frame': frame
+    }
+
+    # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 불완전한 파일을 보지 않도록 함
+    temp_path = f'{snapshot_path}.tmp'
+    with open(temp_path, 'wb') as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, snapshot_path)
+    return snapshot_path
+
+def read_snapshot(csv_path, snapshot_path=None):
+    """유효한 스냅샷이 있으면 DataFrame 반환, 없거나 오래되었으면 None
+
+    스냅샷이 CSV보다 최신이면 바로 사용하고, 그렇지 않으면(git checkout 등으로
+    수정 시각이 뒤바뀐 경우) 원본 CSV 해시가 같을 때만 사용한다.
+    """
+    snapshot_path = snapshot_path or default_snapshot_path(csv_path)
+    if not os.path.exists(snapshot_path):
+        return None
+
+    try:
+        with open(snapshot_path, 'rb') as f:
+            payload = pickle.load(f)
+    except Exception as e:
+        print(f"스냅샷 로드 오류 ({snapshot_path}): {e}")
+        return None
+
+    if payload.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+        return None
+
+    if os.path.exists(csv_path):
+        is_newer = os.path.getmtime(snapshot_path) >= os.path.getmtime(csv_path)
+        if not is_newer and payload.get('source_sha256') != file_sha256(csv_path):
+            return None
+
+    return payload['frame']
+
+if __name__ == '__main__':
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else '경북_관련_사업_700개_최종선별.csv'
+    snapshot_path = sys.argv[2] if len(sys.argv) > 2 else None
+
+    started = time.perf_counter()
+    written = write_snapshot(csv_path, snapshot_path)
+    print(f"스냅샷 생성 완료: {written} ({time.perf_counter() - started:.3f}초)")
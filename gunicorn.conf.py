@@ -0,0 +1,39 @@
+"""
+경북 700개 사업 웹 시스템 gunicorn 설정
+
+- preload_app: 마스터 프로세스에서 데이터와 인덱스를 한 번만 구축한 뒤 워커를 fork
+  (워커는 copy-on-write로 같은 메모리를 공유하므로 워커를 늘려도 로드 시간·메모리가 거의 늘지 않음)
+- fork 직전 gc.freeze(): 공유 객체를 GC 추적 대상에서 빼서 워커의 GC가 공유 페이지를 건드리지 않게 함
+- 데이터 변경 감시 스레드는 fork 후 각 워커에서 시작 (재로드 API 요청을 모든 워커에 전파)
+
+사용법: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import gc
+import multiprocessing
+import os
+
+# app.py가 import 시점에 감시 스레드를 띄우지 않도록 표시 (마스터에는 스레드를 두지 않음)
+os.environ['GUNICORN_PRELOAD'] = '1'
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', str(min(multiprocessing.cpu_count() * 2 + 1, 8))))
+threads = int(os.environ.get('GUNICORN_THREADS', '1'))
+preload_app = True
+
+# 대용량 내보내기·ZIP 다운로드를 고려한 요청 시간 제한(초)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+graceful_timeout = 30
+
+accesslog = '-'
+errorlog = '-'
+
+def when_ready(server):
+    """데이터 로드가 끝난 마스터에서 워커 fork 직전 공유 객체 고정"""
+    gc.freeze()
+    server.log.info(f"데이터 사전 로드 완료, 공유 객체 {gc.get_freeze_count()}개 고정")
+
+def post_fork(server, worker):
+    """워커별 감시 스레드 시작 (DATA_RELOAD_INTERVAL 미설정 시 재로드 요청 표시 파일만 확인)"""
+    from app import dataset_reloader
+    dataset_reloader.start_watcher()
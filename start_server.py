@@ -14,12 +14,9 @@ def check_requirements():
     """필수 파일 및 의존성 확인"""
     print("🔍 시스템 요구사항 확인 중...")
     
-    # 필수 CSV 파일 확인
+    # 필수 CSV 파일 확인 (등급별 CSV는 VALIDATE_GRADE_CSV 검증 시에만 사용)
     required_files = [
         '경북_관련_사업_700개_최종선별.csv',
-        '경북_A급_직접관련_최종선별.csv', 
-        '경북_B급_간접관련_최종선별.csv',
-        '경북_C급_정책참고_최종선별.csv',
         '경북연구원_검토의견서_생성기.py'
     ]
     
@@ -5,6 +5,11 @@
  * - 검토의견서 생성
  */
 
+// 검토의견서 작업 폴링: 조회 간격, 연속 조회 실패 허용 횟수, 진행 없이 기다리는 최대 시간
+const REPORT_POLL_INTERVAL_MS = 500;
+const REPORT_POLL_MAX_ERRORS = 5;
+const REPORT_POLL_STALL_MS = 5 * 60 * 1000;
+
 class GyeongbukDashboard {
     constructor() {
         this.selectedProjects = new Set();
@@ -28,6 +33,7 @@ class GyeongbukDashboard {
         document.getElementById('grade-filter').addEventListener('change', () => this.applyFilters());
         document.getElementById('type-filter').addEventListener('change', () => this.applyFilters());
         document.getElementById('region-filter').addEventListener('change', () => this.applyFilters());
+        document.getElementById('sort-select').addEventListener('change', () => this.applyFilters());
         document.getElementById('search-input').addEventListener('input', this.debounce(() => this.applyFilters(), 500));
         
         // 점수 범위 슬라이더
@@ -136,6 +142,7 @@ class GyeongbukDashboard {
             this.populateSelect('region-filter', filters.regions || []);
             
             console.log('필터 옵션 로드 완료');
+            this.loadFacets();
         } catch (error) {
             console.error('필터 옵션 로드 오류:', error);
             this.showToast('필터 옵션을 불러오는 중 오류가 발생했습니다.', 'error');
@@ -165,6 +172,37 @@ class GyeongbukDashboard {
         }
     }
     
+    async loadFacets() {
+        // 현재 필터 조건에서 각 선택 항목의 건수 표시 (0건 항목은 비활성화)
+        try {
+            const params = new URLSearchParams(this.currentFilters);
+            const response = await fetch(`/api/facets?${params}`);
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+            const data = await response.json();
+            
+            this.applyFacetCounts('dept-filter', data.facets.department || []);
+            this.applyFacetCounts('grade-filter', data.facets.grade || []);
+            this.applyFacetCounts('type-filter', data.facets.type || []);
+            this.applyFacetCounts('region-filter', data.facets.region || []);
+        } catch (error) {
+            console.error('패싯 로드 오류:', error);
+        }
+    }
+    
+    applyFacetCounts(selectId, facets) {
+        const select = document.getElementById(selectId);
+        const counts = new Map(facets.map(facet => [facet.value, facet.count]));
+        
+        // 첫 번째 "전체" 옵션 제외
+        Array.from(select.options).slice(1).forEach(option => {
+            const count = counts.get(option.value) || 0;
+            option.textContent = `${option.value} (${count.toLocaleString()})`;
+            option.disabled = count === 0 && option.value !== select.value;
+        });
+    }
+    
     async loadProjects(page = 1) {
         this.showLoading(true);
         
@@ -325,7 +363,8 @@ class GyeongbukDashboard {
             region: document.getElementById('region-filter').value,
             search: document.getElementById('search-input').value,
             min_score: document.getElementById('min-score').value,
-            max_score: document.getElementById('max-score').value
+            max_score: document.getElementById('max-score').value,
+            sort: document.getElementById('sort-select').value
         };
         
         // 빈 값 제거
@@ -336,6 +375,7 @@ class GyeongbukDashboard {
         });
         
         this.loadProjects(1);
+        this.loadFacets();
     }
     
     resetFilters() {
@@ -344,6 +384,7 @@ class GyeongbukDashboard {
         document.getElementById('type-filter').value = '';
         document.getElementById('region-filter').value = '';
         document.getElementById('search-input').value = '';
+        document.getElementById('sort-select').value = '';
         document.getElementById('min-score').value = '0';
         document.getElementById('max-score').value = '300';
         document.getElementById('min-score-label').textContent = '0';
@@ -351,6 +392,7 @@ class GyeongbukDashboard {
         
         this.currentFilters = {};
         this.loadProjects(1);
+        this.loadFacets();
     }
     
     toggleSelectAll(checked) {
@@ -552,15 +594,8 @@ class GyeongbukDashboard {
         document.getElementById('report-results').style.display = 'none';
         
         try {
-            // 진행 상황 시뮬레이션
-            let progress = 0;
-            const progressInterval = setInterval(() => {
-                progress += Math.random() * 15;
-                if (progress > 85) progress = 85;
-                document.getElementById('progress-fill').style.width = `${progress}%`;
-            }, 800);
-            
-            const response = await fetch('/api/generate_report', {
+            // 백그라운드 생성 작업 등록
+            const response = await fetch('/api/report_jobs', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -570,66 +605,118 @@ class GyeongbukDashboard {
                 })
             });
             
-            clearInterval(progressInterval);
-            document.getElementById('progress-fill').style.width = '100%';
+            let job = await response.json();
             
-            const result = await response.json();
-            
-            if (result.error) {
-                throw new Error(result.error);
+            if (job.error) {
+                throw new Error(job.error);
             }
             
-            // 결과 표시
-            document.querySelector('.report-progress').style.display = 'none';
-            document.getElementById('report-results').style.display = 'block';
-            
-            const resultsHtml = `
-                <div class="report-summary" style="text-align: center; margin-bottom: 1.5rem; padding: 1rem; background: var(--bg-secondary); border-radius: var(--radius-md);">
-                    <h4 style="color: var(--success-color); margin-bottom: 0.5rem;">
-                        <i class="fas fa-check-circle"></i> 검토의견서 생성 완료
-                    </h4>
-                    <p>총 ${result.generated_count}개의 검토의견서가 생성되었습니다.</p>
-                </div>
-                <div class="report-files">
-                    ${result.files.map(file => `
-                        <div class="report-file">
-                            <div class="report-file-info">
-                                <div class="report-file-name">${this.escapeHtml(file.filename)}</div>
-                                <div class="report-file-details">
-                                    프로젝트: ${this.escapeHtml(file.project_name)} | 우선순위: ${file.priority}%
-                                </div>
-                            </div>
-                            <div class="report-file-actions">
-                                <a href="/download_report/${encodeURIComponent(file.filename)}" 
-                                   class="btn btn-primary" style="padding: 0.5rem 1rem; font-size: 0.875rem;" target="_blank">
-                                    <i class="fas fa-download"></i> 다운로드
-                                </a>
-                            </div>
-                        </div>
-                    `).join('')}
-                </div>
-            `;
+            // 실제 진행 상황 폴링 (작업 실패, 연속 조회 실패, 진행 없는 대기 시간 초과 시 중단)
+            let errorCount = 0;
+            let lastDone = -1;
+            let lastProgressAt = Date.now();
+            while (job.status === 'queued' || job.status === 'running') {
+                this.updateReportProgress(job);
+                const done = job.completed + job.failed;
+                if (done !== lastDone) {
+                    lastDone = done;
+                    lastProgressAt = Date.now();
+                } else if (Date.now() - lastProgressAt > REPORT_POLL_STALL_MS) {
+                    throw new Error('검토의견서 생성이 오랫동안 진행되지 않아 확인을 중단했습니다.');
+                }
+                await new Promise(resolve => setTimeout(resolve, REPORT_POLL_INTERVAL_MS));
+                
+                try {
+                    const statusResponse = await fetch(`/api/report_jobs/${job.job_id}`);
+                    if (!statusResponse.ok) {
+                        throw new Error(`HTTP ${statusResponse.status}: ${statusResponse.statusText}`);
+                    }
+                    job = await statusResponse.json();
+                    errorCount = 0;
+                } catch (error) {
+                    // 일시적인 네트워크 오류는 재시도, 연속으로 실패하면 중단
+                    errorCount += 1;
+                    if (errorCount >= REPORT_POLL_MAX_ERRORS) {
+                        throw error;
+                    }
+                }
+            }
+            if (job.status === 'failed') {
+                throw new Error(job.error || '검토의견서 생성 작업이 중단되었습니다.');
+            }
+            this.updateReportProgress(job);
             
-            document.getElementById('report-results').innerHTML = resultsHtml;
+            this.renderReportResults({
+                job_id: job.job_id,
+                generated_count: job.completed,
+                files: job.files
+            });
             
-            this.showToast(`${result.generated_count}개의 검토의견서가 생성되었습니다.`, 'success');
+            this.showToast(`${job.completed}개의 검토의견서가 생성되었습니다.`, 'success');
             
         } catch (error) {
             console.error('검토의견서 생성 오류:', error);
-            clearInterval(progressInterval);
             document.querySelector('.report-progress').style.display = 'none';
             document.getElementById('report-results').style.display = 'block';
             document.getElementById('report-results').innerHTML = `
                 <div class="error-message" style="text-align: center; padding: 2rem; color: var(--danger-color);">
                     <i class="fas fa-exclamation-triangle" style="font-size: 2rem; margin-bottom: 1rem;"></i>
                     <p style="font-size: 1.125rem; font-weight: 600; margin-bottom: 0.5rem;">검토의견서 생성 중 오류가 발생했습니다.</p>
-                    <p class="error-detail" style="font-size: 0.875rem; color: var(--text-secondary);">${error.message}</p>
+                    <p class="error-detail" style="font-size: 0.875rem; color: var(--text-secondary);">${this.escapeHtml(error.message)}</p>
                 </div>
             `;
             this.showToast('검토의견서 생성 중 오류가 발생했습니다.', 'error');
         }
     }
     
+    updateReportProgress(job) {
+        const done = job.completed + job.failed;
+        document.getElementById('progress-fill').style.width = `${job.progress}%`;
+        document.getElementById('progress-text').textContent =
+            `검토의견서를 생성하고 있습니다... (${done}/${job.total})`;
+    }
+    
+    renderReportResults(result) {
+        // 결과 표시
+        document.querySelector('.report-progress').style.display = 'none';
+        document.getElementById('report-results').style.display = 'block';
+        
+        const resultsHtml = `
+            <div class="report-summary" style="text-align: center; margin-bottom: 1.5rem; padding: 1rem; background: var(--bg-secondary); border-radius: var(--radius-md);">
+                <h4 style="color: var(--success-color); margin-bottom: 0.5rem;">
+                    <i class="fas fa-check-circle"></i> 검토의견서 생성 완료
+                </h4>
+                <p>총 ${result.generated_count}개의 검토의견서가 생성되었습니다.</p>
+                ${result.job_id && result.files.length > 1 ? `
+                    <a href="/api/report_jobs/${encodeURIComponent(result.job_id)}/zip"
+                       class="btn btn-primary" style="margin-top: 0.75rem; padding: 0.5rem 1rem; font-size: 0.875rem;">
+                        <i class="fas fa-file-archive"></i> 전체 ZIP 다운로드
+                    </a>
+                ` : ''}
+            </div>
+            <div class="report-files">
+                ${result.files.map(file => `
+                    <div class="report-file">
+                        <div class="report-file-info">
+                            <div class="report-file-name">${this.escapeHtml(file.filename)}</div>
+                            <div class="report-file-details">
+                                프로젝트: ${this.escapeHtml(file.project_name)} | 우선순위: ${file.priority}%
+                            </div>
+                        </div>
+                        <div class="report-file-actions">
+                            <a href="${file.file_id ? `/api/reports/${file.file_id}` : `/download_report/${encodeURIComponent(file.filename)}`}" 
+                               class="btn btn-primary" style="padding: 0.5rem 1rem; font-size: 0.875rem;" target="_blank">
+                                <i class="fas fa-download"></i> 다운로드
+                            </a>
+                        </div>
+                    </div>
+                `).join('')}
+            </div>
+        `;
+        
+        document.getElementById('report-results').innerHTML = resultsHtml;
+    }
+    
     async exportExcel() {
         try {
             this.showToast('엑셀 파일을 생성하고 있습니다...', 'info');
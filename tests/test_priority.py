@@ -0,0 +1,40 @@
+"""우선순위 % 일괄 계산(calculate_priority_percentages)과 행 단위 계산 일치 검증"""
+
+import os
+import sys
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from 경북연구원_검토의견서_생성기 import GyeongbukResearchInstituteReportGenerator  # noqa: E402
+
+DATA_CSV = os.path.join(ROOT, '경북_관련_사업_700개_최종선별.csv')
+
+
+def make_generator(df):
+    return GyeongbukResearchInstituteReportGenerator(df_projects=df)
+
+
+def test_bundled_dataset_has_no_mismatches():
+    df = pd.read_csv(DATA_CSV)
+    assert len(df) == 700
+    assert make_generator(df).verify_priority_percentages() == []
+
+
+def test_parsed_budget_column_has_no_mismatches():
+    # 웹 앱은 로드 시 사업비를 천원 단위 숫자 컬럼(사업비_천원)으로 변환해 두고 일괄 계산
+    df = pd.read_csv(DATA_CSV)
+    df['사업비_천원'] = pd.to_numeric(
+        df['사업비'].str.replace(',', '', regex=False).str.replace('천원', '', regex=False),
+        errors='coerce'
+    )
+    assert make_generator(df).verify_priority_percentages() == []
+
+
+def test_missing_text_columns_have_no_mismatches():
+    df = pd.read_csv(DATA_CSV).drop(columns=['사업내용', '주요부처']).head(100)
+    generator = make_generator(df)
+    assert generator.verify_priority_percentages() == []
+    assert len(generator.calculate_priority_percentages(df)) == 100
@@ -0,0 +1,92 @@
+"""데이터 재로드와 디스크 보관 컬럼 검증
+
+재로드 API는 처리 중인 요청이 이전 세대로 끝나도록 전역 매니저만 교체한다.
+새 데이터 버전의 저장소를 만들며 이전 버전 파일이 정리되더라도, 이전 매니저는
+열어 둔 파일로 계속 읽어야 하고, 읽을 수 없으면 빈 값 대신 오류로 응답해야 한다.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# app은 import 시점에 데이터를 로드하므로 임시 폴더의 데이터·저장소 경로를 먼저 지정
+SCRATCH_DIR = tempfile.mkdtemp(prefix='gyeongbuk-test-')
+DATA_CSV = os.path.join(SCRATCH_DIR, 'projects.csv')
+shutil.copy(os.path.join(ROOT, '경북_관련_사업_700개_최종선별.csv'), DATA_CSV)
+os.environ.update({
+    'DATA_CSV': DATA_CSV,
+    'REPORT_TEMP_DIR': os.path.join(SCRATCH_DIR, 'temp_reports'),
+    'COLD_STORE_DIR': os.path.join(SCRATCH_DIR, 'cold_columns'),
+    'COMPACT_STORAGE': '1',
+    'ADMIN_TOKEN': 'test-token',
+    'DATA_RELOAD_INTERVAL': '0',
+    'RELOAD_MARKER_INTERVAL': '0'
+})
+
+import app  # noqa: E402
+
+SOURCE_COLUMN = '출처파일'
+
+
+@pytest.fixture(scope='module', autouse=True)
+def remove_scratch_dir():
+    yield
+    shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+
+
+def admin_reload(client):
+    return client.post('/api/admin/reload', headers={'X-Admin-Token': 'test-token'})
+
+
+def test_old_manager_reads_cold_column_after_reload(monkeypatch):
+    client = app.app.test_client()
+    old_manager = app.project_manager
+    assert old_manager.cold_store is not None and SOURCE_COLUMN in old_manager.cold_store.columns
+    expected = pd.read_csv(DATA_CSV)[SOURCE_COLUMN].astype(str).tolist()
+    old_files = {name for name in os.listdir(old_manager.cold_store.root) if name.startswith(old_manager.data_version)}
+    
+    # 데이터를 바꾸고 재로드 (이전 버전 파일을 유예 시간 없이 바로 정리하게 하여 최악의 경우 재현)
+    df = pd.read_csv(DATA_CSV)
+    df.loc[0, '단위사업명'] = f"{df.loc[0, '단위사업명']} (수정)"
+    df.to_csv(DATA_CSV, index=False)
+    monkeypatch.setattr(app.ColdColumnStore, 'STALE_FILE_SECONDS', -1)
+    
+    response = admin_reload(client)
+    assert response.status_code == 200
+    new_manager = app.project_manager
+    assert new_manager is not old_manager
+    assert new_manager.data_version != old_manager.data_version
+    assert not old_files & set(os.listdir(old_manager.cold_store.root))
+    
+    # 이전 세대 매니저: 지워진 파일을 열린 핸들로 계속 읽음
+    assert old_manager.get_project_detail(5)['source'] == expected[5]
+    frame = old_manager.project_frame(list(range(len(expected))), [SOURCE_COLUMN])
+    assert frame[SOURCE_COLUMN].astype(str).tolist() == expected
+    
+    # 새 세대도 같은 컬럼을 읽음
+    assert client.get('/api/project/5').get_json()['source'] == expected[5]
+
+
+def test_unreadable_cold_column_is_server_error(monkeypatch):
+    client = app.app.test_client()
+    store = app.project_manager.cold_store
+    
+    def fail_read(positions):
+        raise OSError('읽기 실패')
+    
+    def fail_rebuild():
+        raise ValueError('원본 데이터가 로드 이후 변경됨')
+    
+    # 파일을 읽을 수 없고 복구도 실패하면 빈 값(nan) 대신 500 응답
+    monkeypatch.setattr(store, '_read', fail_read)
+    monkeypatch.setattr(store, '_rebuild', fail_rebuild)
+    assert client.get('/api/project/5').status_code == 500
+    response = client.post('/api/export', json={'format': 'csv', 'columns': 'all'})
+    assert response.status_code == 500
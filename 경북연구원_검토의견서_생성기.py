@@ -6,18 +6,117 @@
 - 더미정보는 § 표시
 """
 import pandas as pd
+import numpy as np
 import os
 from datetime import datetime
 import re
+import argparse
+import hashlib
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+class KeywordMatcher:
+    """Aho–Corasick 다중 패턴 매처
+
+    (패턴, 라벨) 목록으로 오토마톤을 한 번 구축하고, 텍스트를 한 번 훑어
+    포함된 모든 패턴의 라벨 집합을 반환한다. 대소문자는 구분하지 않는다.
+    """
+    
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+        
+        # 트라이 구축
+        for pattern, label in patterns:
+            node = 0
+            for char in str(pattern).lower():
+                next_node = self.goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(set())
+                    self.goto[node][char] = next_node
+                node = next_node
+            self.output[node].add(label)
+        
+        # 실패 링크 구축 (BFS), 실패 노드의 출력 라벨을 미리 합쳐 둠
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self.goto[node].items():
+                queue.append(next_node)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_node] = self.goto[fallback].get(char, 0)
+                self.output[next_node] |= self.output[self.fail[next_node]]
+    
+    def find(self, text):
+        """텍스트에 포함된 모든 패턴의 라벨 집합 반환"""
+        labels = set()
+        node = 0
+        for char in str(text).lower():
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+            if self.output[node]:
+                labels |= self.output[node]
+        return labels
 
 class GyeongbukResearchInstituteReportGenerator:
-    def __init__(self):
-        """경북연구원 검토의견서 생성기 초기화"""
-        self.df_projects = pd.read_csv('경북_관련_사업_700개_최종선별.csv')
-        self.output_dir = '검토의견서'
-        
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+    # 검토의견서 템플릿 버전 (본문·파일명 형식이 바뀌면 증가, 캐시·매니페스트 키에 포함)
+    TEMPLATE_VERSION = '2026.2'
+    
+    # 검토의견서 본문에 쓰이는 컬럼 (파일명 구분 해시 계산 대상)
+    REPORT_INPUT_COLUMNS = ('단위사업명', '주요부처', '사업내용', '사업비', '사업유형', '경북관련성_최종')
+    
+    # 캐시용 렌더링 시 검토일자 자리 표시자 (제공 시점에 실제 날짜로 치환)
+    DATE_PLACEHOLDER = '\x00검토일자\x00'
+    
+    # 우선순위 계산 기준
+    GRADE_BASE_SCORES = [('A급', 92), ('B급', 75), ('C급', 58)]
+    DEFAULT_BASE_SCORE = 45
+    STRATEGIC_MINISTRIES = ['산업통상자원부', '과학기술정보통신부']
+    IMPORTANT_MINISTRIES = ['국토교통부', '해양수산부', '중소벤처기업부']
+    BUDGET_BONUSES = [(2000, 6), (1000, 4), (500, 2)]
+    STRATEGIC_KEYWORDS = ['방사광', '가속기', '원자력', 'SMR', '반도체', 'AI', '디지털']
+    
+    # 사업명 대표 키워드 분류 (앞쪽 분류가 우선)
+    KEY_TERMS = {
+        'AI': ['AI', '인공지능', '지능형'],
+        '디지털': ['디지털', '정보화', 'ICT'],
+        '기술개발': ['기술개발', 'R&D', '연구개발', '개발'],
+        '혁신': ['혁신', '창신'],
+        '스마트': ['스마트', '지능'],
+        '해양': ['해양', '수산', '어업'],
+        '교통': ['교통', '도로', '철도'],
+        '환경': ['환경', '친환경', '그린'],
+        '안전': ['안전', '방재'],
+        '원자력': ['원자력', 'SMR', '방사광'],
+        '반도체': ['반도체', '소재', '부품'],
+        '바이오': ['바이오', '의료'],
+        '문화': ['문화', '관광'],
+        '교육': ['교육', '인재'],
+        '에너지': ['에너지', '전력'],
+        '건설': ['건설', '인프라'],
+        '농업': ['농업', '농촌'],
+        '제조': ['제조', '생산']
+    }
+    
+    def __init__(self, df_projects=None, output_dir='검토의견서'):
+        """경북연구원 검토의견서 생성기 초기화
+
+        Args:
+            df_projects: 이미 로드된 사업 DataFrame (없으면 CSV에서 로드)
+            output_dir: generate_all_reports 저장 폴더 (생성 시점에 만듦)
+        """
+        if df_projects is None:
+            df_projects = pd.read_csv('경북_관련_사업_700개_최종선별.csv')
+        self.df_projects = df_projects
+        self.output_dir = output_dir
         
         # 123 국정과제 기반 정책 방향
         self.national_tasks = {
@@ -77,71 +176,143 @@ class GyeongbukResearchInstituteReportGenerator:
             }
         }
     
+        self.keyword_matcher = self.build_keyword_matcher()
+    
+    def build_keyword_matcher(self):
+        """대표 키워드·국정과제 키워드·전략 키워드 통합 매처 구축
+
+        라벨은 ('key_term', 분류), ('national_task', 정책방향, 키워드), ('strategic', 키워드) 형식이다.
+        """
+        patterns = []
+        for category, terms in self.KEY_TERMS.items():
+            patterns.extend((term, ('key_term', category)) for term in terms)
+        for direction, info in self.national_tasks.items():
+            patterns.extend((keyword, ('national_task', direction, keyword)) for keyword in info['키워드'])
+        patterns.extend((keyword, ('strategic', keyword)) for keyword in self.STRATEGIC_KEYWORDS)
+        return KeywordMatcher(patterns)
+    
+    def get_budget_billion(self, row):
+        """사업비 예산 규모 반환 (변환 실패 시 기본값 100)
+
+        로드 시점에 변환된 '사업비_천원' 컬럼이 있으면 그대로 사용하고,
+        없으면 '사업비' 문자열을 직접 변환한다.
+        """
+        budget_num = row.get('사업비_천원')
+        if budget_num is None:
+            budget_str = str(row['사업비'])
+            if '천원' in budget_str:
+                try:
+                    budget_num = int(budget_str.replace('천원', '').replace(',', ''))
+                except ValueError:
+                    budget_num = None
+        
+        if budget_num is None or pd.isna(budget_num):
+            return 100
+        return budget_num / 1000000
+    
     def calculate_priority_percentage(self, row):
         """우선순위 % 계산"""
-        grade = str(row['경북관련성_최종'])
-        ministry = str(row['주요부처'])
-        budget_str = str(row['사업비'])
-        project_name = str(row['단위사업명'])
-        content = str(row['사업내용'])
+        grade = str(row.get('경북관련성_최종', ''))
+        ministry = str(row.get('주요부처', ''))
+        project_name = str(row.get('단위사업명', ''))
+        content = str(row.get('사업내용', ''))
         
         # 기본 점수
-        if 'A급' in grade:
-            base_score = 92
-        elif 'B급' in grade:
-            base_score = 75
-        elif 'C급' in grade:
-            base_score = 58
-        else:
-            base_score = 45
+        base_score = self.DEFAULT_BASE_SCORE
+        for grade_key, grade_score in self.GRADE_BASE_SCORES:
+            if grade_key in grade:
+                base_score = grade_score
+                break
         
         # 부처 가중치
-        strategic_ministries = ['산업통상자원부', '과학기술정보통신부']
-        important_ministries = ['국토교통부', '해양수산부', '중소벤처기업부']
-        
-        if ministry in strategic_ministries:
+        if ministry in self.STRATEGIC_MINISTRIES:
             base_score += 8
-        elif ministry in important_ministries:
+        elif ministry in self.IMPORTANT_MINISTRIES:
             base_score += 5
         
         # 예산 가중치
-        budget_billion = 100  # 기본값
-        if '천원' in budget_str:
-            try:
-                budget_num = int(budget_str.replace('천원', '').replace(',', ''))
-                budget_billion = budget_num / 1000000
-            except:
-                pass
-        
-        if budget_billion >= 2000:
-            base_score += 6
-        elif budget_billion >= 1000:
-            base_score += 4
-        elif budget_billion >= 500:
-            base_score += 2
+        budget_billion = self.get_budget_billion(row)
+        
+        for threshold, bonus in self.BUDGET_BONUSES:
+            if budget_billion >= threshold:
+                base_score += bonus
+                break
         
         # 전략 키워드 가중치
-        strategic_keywords = ['방사광', '가속기', '원자력', 'SMR', '반도체', 'AI', '디지털']
-        combined_text = f'{project_name} {content}'.lower()
+        combined_text = f'{project_name} {content}'
         
-        for keyword in strategic_keywords:
-            if keyword.lower() in combined_text:
-                base_score += 4
-                break
+        if any(label[0] == 'strategic' for label in self.keyword_matcher.find(combined_text)):
+            base_score += 4
         
         return min(base_score, 99)
     
+    @classmethod
+    def calculate_priority_percentages(cls, df):
+        """전체 사업 우선순위 % 일괄 계산 (calculate_priority_percentage의 벡터화 버전)"""
+        def text_column(column):
+            # 컬럼이 없으면 행 단위 계산(row.get)과 같이 빈 문자열로 처리
+            if column not in df.columns:
+                return pd.Series('', index=df.index)
+            return df[column].fillna('').astype(str)
+        
+        grade = text_column('경북관련성_최종')
+        ministry = text_column('주요부처')
+        
+        # 기본 점수
+        score = pd.Series(np.select(
+            [grade.str.contains(grade_key, regex=False).to_numpy() for grade_key, _ in cls.GRADE_BASE_SCORES],
+            [grade_score for _, grade_score in cls.GRADE_BASE_SCORES],
+            cls.DEFAULT_BASE_SCORE
+        ), index=df.index)
+        
+        # 부처 가중치
+        score += np.select(
+            [ministry.isin(cls.STRATEGIC_MINISTRIES).to_numpy(), ministry.isin(cls.IMPORTANT_MINISTRIES).to_numpy()],
+            [8, 5],
+            0
+        )
+        
+        # 예산 가중치 (변환 실패 시 기본값 100)
+        if '사업비_천원' in df.columns:
+            budget_num = df['사업비_천원']
+        else:
+            budget_str = text_column('사업비')
+            budget_num = pd.to_numeric(
+                budget_str.str.replace('천원', '', regex=False).str.replace(',', '', regex=False),
+                errors='coerce'
+            ).where(budget_str.str.contains('천원', regex=False))
+        budget_billion = (budget_num / 1000000).fillna(100).to_numpy()
+        score += np.select(
+            [budget_billion >= threshold for threshold, _ in cls.BUDGET_BONUSES],
+            [bonus for _, bonus in cls.BUDGET_BONUSES],
+            0
+        )
+        
+        # 전략 키워드 가중치
+        combined_text = (text_column('단위사업명') + ' ' + text_column('사업내용')).str.lower()
+        pattern = '|'.join(re.escape(keyword.lower()) for keyword in cls.STRATEGIC_KEYWORDS)
+        score += np.where(combined_text.str.contains(pattern, regex=True).to_numpy(), 4, 0)
+        
+        return score.clip(upper=99).astype(int)
+    
+    def verify_priority_percentages(self, df=None):
+        """행 단위 계산과 일괄 계산 결과 비교, 불일치 행 인덱스 목록 반환"""
+        df = self.df_projects if df is None else df
+        vectorized = self.calculate_priority_percentages(df)
+        return [
+            idx for idx, row in df.iterrows()
+            if self.calculate_priority_percentage(row) != vectorized[idx]
+        ]
+    
     def get_policy_direction(self, project_text):
         """사업 내용 기반 정책 방향 결정"""
-        text = str(project_text).lower()
+        matched = self.keyword_matcher.find(project_text)
         best_match = '혁신경제 도약'
         max_score = 0
         
-        for direction, info in self.national_tasks.items():
-            score = 0
-            for keyword in info['키워드']:
-                if keyword.lower() in text:
-                    score += 1
+        # 정책 방향별 포함된 키워드 수 (동점이면 앞쪽 방향 우선)
+        for direction in self.national_tasks:
+            score = sum(1 for label in matched if label[0] == 'national_task' and label[1] == direction)
             
             if score > max_score:
                 max_score = score
@@ -151,63 +322,36 @@ class GyeongbukResearchInstituteReportGenerator:
     
     def extract_keywords(self, project_name):
         """사업명에서 대표 키워드 추출"""
-        keywords = []
-        key_terms = {
-            'AI': ['AI', '인공지능', '지능형'],
-            '디지털': ['디지털', '정보화', 'ICT'],
-            '기술개발': ['기술개발', 'R&D', '연구개발', '개발'],
-            '혁신': ['혁신', '창신'],
-            '스마트': ['스마트', '지능'],
-            '해양': ['해양', '수산', '어업'],
-            '교통': ['교통', '도로', '철도'],
-            '환경': ['환경', '친환경', '그린'],
-            '안전': ['안전', '방재'],
-            '원자력': ['원자력', 'SMR', '방사광'],
-            '반도체': ['반도체', '소재', '부품'],
-            '바이오': ['바이오', '의료'],
-            '문화': ['문화', '관광'],
-            '교육': ['교육', '인재'],
-            '에너지': ['에너지', '전력'],
-            '건설': ['건설', '인프라'],
-            '농업': ['농업', '농촌'],
-            '제조': ['제조', '생산']
-        }
+        matched = {label[1] for label in self.keyword_matcher.find(project_name) if label[0] == 'key_term'}
         
-        project_lower = project_name.lower()
+        for category in self.KEY_TERMS:
+            if category in matched:
+                return category
         
-        for category, terms in key_terms.items():
-            for term in terms:
-                if term.lower() in project_lower:
-                    keywords.append(category)
-                    break
-        
-        return keywords[0] if keywords else '기타'
+        return '기타'
     
-    def generate_comprehensive_report(self, row, priority):
-        """A4 4장 분량의 종합 검토의견서 생성"""
+    def generate_comprehensive_report(self, row, priority, current_date=None):
+        """A4 4장 분량의 종합 검토의견서 생성
+
+        current_date를 주지 않으면 오늘 날짜를 검토일자로 사용한다.
+        """
         
         # 기본 정보 추출
         project_name = str(row['단위사업명'])
         ministry = str(row['주요부처'])
         content = str(row['사업내용'])
-        budget_str = str(row['사업비'])
         grade = str(row['경북관련성_최종'])
         project_type = str(row['사업유형'])
         
         # 예산 처리
-        budget_billion = 100
-        if '천원' in budget_str:
-            try:
-                budget_num = int(budget_str.replace('천원', '').replace(',', ''))
-                budget_billion = budget_num / 1000000
-            except:
-                pass
+        budget_billion = self.get_budget_billion(row)
         
         # 키워드 및 정책 방향
         main_keyword = self.extract_keywords(project_name)
         policy_info = self.get_policy_direction(f'{project_name} {content}')
         
-        current_date = datetime.now().strftime('%Y년 %m월 %d일')
+        if current_date is None:
+            current_date = self.format_review_date()
         
         # A4 4장 분량 검토의견서 생성
         report_content = f'''# 2026년도 국가예산안 검토의견서
@@ -847,8 +991,17 @@ class GyeongbukResearchInstituteReportGenerator:
 
         return report_content
     
+    @staticmethod
+    def format_review_date(date=None):
+        """검토일자 문자열 (기본: 오늘)"""
+        return (date or datetime.now()).strftime('%Y년 %m월 %d일')
+    
     def generate_filename(self, row, priority, main_keyword):
-        """파일명 생성: 급수_우선순위%_부처명_과제명(키워드).md"""
+        """파일명 생성: 급수_우선순위%_부처명_과제명(키워드)_구분해시.md
+
+        부처명·과제명을 잘라 쓰므로 서로 다른 사업이 같은 이름이 될 수 있어, 본문에
+        쓰이는 컬럼 값의 해시를 붙인다. 이름이 같으면 본문도 같다.
+        """
         
         grade = str(row['경북관련성_최종'])
         ministry = str(row['주요부처'])
@@ -869,12 +1022,76 @@ class GyeongbukResearchInstituteReportGenerator:
         clean_project = re.sub(r'[^\w가-힣]', '', project_name)[:20]
         clean_keyword = re.sub(r'[^\w가-힣]', '', main_keyword)
         
-        filename = f'{grade_short}_{priority:02d}%_{clean_ministry}_{clean_project}({clean_keyword}).md'
+        row_key = '\x1f'.join(str(row.get(column, '')) for column in self.REPORT_INPUT_COLUMNS)
+        digest = hashlib.sha1(row_key.encode('utf-8')).hexdigest()[:6]
+        
+        filename = f'{grade_short}_{priority:02d}%_{clean_ministry}_{clean_project}({clean_keyword})_{digest}.md'
         
         return filename
     
-    def generate_all_reports(self):
-        """전체 700개 사업 검토의견서 생성"""
+    def build_report(self, row, current_date=None):
+        """단일 사업 검토의견서 생성: (파일명, 본문, 우선순위) 반환"""
+        # 우선순위 계산
+        priority = self.calculate_priority_percentage(row)
+        
+        # 키워드 추출
+        main_keyword = self.extract_keywords(row['단위사업명'])
+        
+        # 검토의견서 생성
+        report_content = self.generate_comprehensive_report(row, priority, current_date)
+        
+        # 파일명 생성
+        filename = self.generate_filename(row, priority, main_keyword)
+        
+        return filename, report_content, priority
+    
+    def write_report(self, row):
+        """단일 사업 검토의견서 생성 후 output_dir에 저장, 파일명 반환"""
+        filename, report_content, _ = self.build_report(row)
+        
+        file_path = os.path.join(self.output_dir, filename)
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(report_content)
+        
+        return filename
+    
+    MANIFEST_FILENAME = '.manifest.json'
+    
+    def compute_row_hashes(self):
+        """행 내용 해시 목록 (16자리 16진수, df_projects 행 순서)"""
+        if self.df_projects.empty:
+            return []
+        hashes = pd.util.hash_pandas_object(self.df_projects, index=False)
+        return [f'{value:016x}' for value in hashes.tolist()]
+    
+    def load_manifest(self):
+        """생성 매니페스트 로드: {행 해시: {'filename', 'template_version'}}"""
+        manifest_path = os.path.join(self.output_dir, self.MANIFEST_FILENAME)
+        try:
+            with open(manifest_path, encoding='utf-8') as f:
+                return json.load(f).get('reports', {})
+        except (OSError, ValueError):
+            return {}
+    
+    def save_manifest(self, reports):
+        """생성 매니페스트 저장 (중단되어도 이전 매니페스트가 깨지지 않도록 교체 방식)"""
+        manifest_path = os.path.join(self.output_dir, self.MANIFEST_FILENAME)
+        temp_path = f'{manifest_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'reports': reports}, f, ensure_ascii=False, indent=0)
+        os.replace(temp_path, manifest_path)
+    
+    def generate_all_reports(self, workers=1, incremental=True):
+        """전체 700개 사업 검토의견서 생성
+
+        매니페스트(output_dir/.manifest.json)에 행 내용 해시별 출력 파일을 기록하여,
+        다시 실행하면 새로 추가되었거나 내용이 바뀐 행만 생성하고 사라진 행의 파일은 삭제한다.
+        배치마다 매니페스트를 저장하므로 중단 후 재실행 시 남은 행부터 이어서 생성한다.
+        
+        Args:
+            workers: 2 이상이면 프로세스 풀로 배치를 나누어 병렬 생성
+            incremental: False이면 매니페스트를 무시하고 전체 생성
+        """
         
         print('=== 경북연구원 700개 사업 검토의견서 생성 시작 ===')
         print('- A4 4장 분량 (약 8,000자)')
@@ -882,64 +1099,186 @@ class GyeongbukResearchInstituteReportGenerator:
         print('- 실행 구현 현실성 포함')
         print('- 더미정보 § 표시')
         
-        generated_count = 0
-        error_count = 0
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        row_hashes = self.compute_row_hashes()
+        reports = self.load_manifest()
+        self._replaced_filenames = set()
+        
+        # 같은 템플릿 버전으로 이미 생성되어 파일이 남아 있는 행은 건너뜀
+        pending = [
+            position for position, row_hash in enumerate(row_hashes)
+            if not incremental
+            or reports.get(row_hash, {}).get('template_version') != self.TEMPLATE_VERSION
+            or not os.path.exists(os.path.join(self.output_dir, reports[row_hash]['filename']))
+        ]
+        skipped_count = len(row_hashes) - len(pending)
+        if skipped_count:
+            print(f'- 변경 없음: {skipped_count}개 사업 건너뜀')
         
         # 배치별 처리 (메모리 효율성)
         batch_size = 50
-        total_batches = (len(self.df_projects) + batch_size - 1) // batch_size
+        batches = [
+            (batch_num, pending[start_idx:start_idx + batch_size])
+            for batch_num, start_idx in enumerate(range(0, len(pending), batch_size))
+        ]
         
-        for batch_num in range(total_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min((batch_num + 1) * batch_size, len(self.df_projects))
-            
-            print(f'\\n배치 {batch_num + 1}/{total_batches}: {start_idx+1}-{end_idx}번 사업 처리 중...')
+        if workers > 1:
+            generated_count, error_count = self._generate_reports_parallel(batches, workers, row_hashes, reports)
+        else:
+            generated_count, error_count = self._generate_reports_sequential(batches, row_hashes, reports)
+        
+        self._remove_stale_reports(row_hashes, reports)
+        
+        return generated_count, error_count
+    
+    def _record_report(self, reports, row_hash, filename):
+        previous = reports.get(row_hash)
+        if previous is not None and previous['filename'] != filename:
+            # 파일명 형식이 바뀌어 다시 생성된 행의 이전 파일 (다른 행이 쓰지 않으면 정리 시 삭제)
+            self._replaced_filenames.add(previous['filename'])
+        reports[row_hash] = {'filename': filename, 'template_version': self.TEMPLATE_VERSION}
+    
+    def _remove_stale_reports(self, row_hashes, reports):
+        """현재 데이터에 없는 행의 매니페스트 항목과, 다른 이름으로 다시 생성된 이전 출력 파일 삭제"""
+        current = set(row_hashes)
+        stale = [row_hash for row_hash in reports if row_hash not in current]
+        replaced = getattr(self, '_replaced_filenames', set())
+        if not stale and not replaced:
+            self.save_manifest(reports)
+            return
+        
+        # 현재 행이 같은 파일명을 쓰고 있으면 파일은 유지
+        live_filenames = {entry['filename'] for row_hash, entry in reports.items() if row_hash in current}
+        candidates = [reports.pop(row_hash)['filename'] for row_hash in stale] + sorted(replaced)
+        removed_count = 0
+        for filename in candidates:
+            file_path = os.path.join(self.output_dir, filename)
+            if filename not in live_filenames and os.path.exists(file_path):
+                os.remove(file_path)
+                removed_count += 1
+        
+        self.save_manifest(reports)
+        print(f'- 삭제된 사업: {len(stale)}개 항목 정리, 이전 파일 포함 {removed_count}개 파일 삭제')
+    
+    def _generate_reports_sequential(self, batches, row_hashes, reports):
+        generated_count = 0
+        error_count = 0
+        total = sum(len(positions) for _, positions in batches)
+        
+        for batch_num, positions in batches:
+            print(f'\\n배치 {batch_num + 1}/{len(batches)}: {positions[0]+1}-{positions[-1]+1}번 사업 처리 중...')
             
-            for idx in range(start_idx, end_idx):
+            for position in positions:
                 try:
-                    row = self.df_projects.iloc[idx]
-                    
-                    # 우선순위 계산
-                    priority = self.calculate_priority_percentage(row)
-                    
-                    # 키워드 추출
-                    main_keyword = self.extract_keywords(row['단위사업명'])
-                    
-                    # 검토의견서 생성
-                    report_content = self.generate_comprehensive_report(row, priority)
-                    
-                    # 파일명 생성
-                    filename = self.generate_filename(row, priority, main_keyword)
-                    
-                    # 파일 저장
-                    file_path = os.path.join(self.output_dir, filename)
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(report_content)
-                    
+                    filename = self.write_report(self.df_projects.iloc[position])
+                    self._record_report(reports, row_hashes[position], filename)
                     generated_count += 1
                     
                     if generated_count % 10 == 0:
-                        print(f'  진행률: {generated_count}/{len(self.df_projects)} ({generated_count/len(self.df_projects)*100:.1f}%)')
+                        print(f'  진행률: {generated_count}/{total} ({generated_count/total*100:.1f}%)')
                     
                 except Exception as e:
                     error_count += 1
-                    print(f'  오류 발생 (행 {idx}): {str(e)[:50]}...')
+                    print(f'  오류 발생 (행 {position}): {str(e)[:50]}...')
                     continue
             
+            self.save_manifest(reports)
+            
             # 배치 완료 보고
-            current_progress = generated_count / len(self.df_projects) * 100
-            print(f'배치 {batch_num + 1} 완료: {end_idx - start_idx}개 처리, 전체 진행률: {current_progress:.1f}%')
+            current_progress = generated_count / total * 100
+            print(f'배치 {batch_num + 1} 완료: {len(positions)}개 처리, 전체 진행률: {current_progress:.1f}%')
+        
+        return generated_count, error_count
+    
+    def _generate_reports_parallel(self, batches, workers, row_hashes, reports):
+        """배치를 프로세스 풀에 분배하고 완료되는 순서대로 집계"""
+        generated_count = 0
+        error_count = 0
+        total = sum(len(positions) for _, positions in batches)
+        
+        print(f'\n병렬 처리: 프로세스 {workers}개, 배치 {len(batches)}개')
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_report_worker,
+            initargs=(self.output_dir,)
+        ) as executor:
+            futures = {
+                executor.submit(_write_report_batch, self.df_projects.iloc[positions]): (batch_num, positions)
+                for batch_num, positions in batches
+            }
+            
+            for future in as_completed(futures):
+                batch_num, positions = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # 배치 전체 실패 (프로세스 비정상 종료 등)
+                    error_count += len(positions)
+                    print(f'  배치 {batch_num + 1} 오류: {str(e)[:50]}...')
+                    continue
+                
+                for position, (filename, error) in zip(positions, results):
+                    if error is None:
+                        self._record_report(reports, row_hashes[position], filename)
+                        generated_count += 1
+                        if generated_count % 10 == 0:
+                            print(f'  진행률: {generated_count}/{total} ({generated_count/total*100:.1f}%)')
+                    else:
+                        error_count += 1
+                        print(f'  오류 발생 (행 {position}): {error[:50]}...')
+                
+                self.save_manifest(reports)
+                
+                current_progress = generated_count / total * 100
+                print(f'배치 {batch_num + 1} 완료: {len(positions)}개 처리, 전체 진행률: {current_progress:.1f}%')
         
         return generated_count, error_count
 
+# 병렬 생성 시 프로세스별 생성기 (CSV를 다시 읽지 않도록 빈 DataFrame으로 초기화)
+_worker_generator = None
+
+def _init_report_worker(output_dir):
+    global _worker_generator
+    _worker_generator = GyeongbukResearchInstituteReportGenerator(df_projects=pd.DataFrame(), output_dir=output_dir)
+
+def _write_report_batch(batch):
+    """프로세스 풀 작업: 배치의 각 행을 생성·저장하고 (파일명, 오류 메시지) 목록 반환"""
+    results = []
+    for _, row in batch.iterrows():
+        try:
+            results.append((_worker_generator.write_report(row), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='경북연구원 검토의견서 생성기')
+    parser.add_argument('--verify-priority', action='store_true',
+                        help='행 단위/일괄 우선순위 계산 결과 일치 여부만 검사')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='병렬 생성 프로세스 수 (기본 1: 순차 처리)')
+    parser.add_argument('--full', action='store_true',
+                        help='매니페스트를 무시하고 전체 사업 검토의견서 재생성')
+    args = parser.parse_args()
+    
     generator = GyeongbukResearchInstituteReportGenerator()
-    generated, errors = generator.generate_all_reports()
+    
+    if args.verify_priority:
+        mismatches = generator.verify_priority_percentages()
+        if mismatches:
+            print(f'❌ 우선순위 불일치: {len(mismatches)}개 행 {mismatches[:20]}')
+            raise SystemExit(1)
+        print(f'✅ 우선순위 일치: 전체 {len(generator.df_projects)}개 행')
+        raise SystemExit(0)
+    
+    generated, errors = generator.generate_all_reports(workers=args.workers, incremental=not args.full)
     
     print(f'\\n🎉 경북연구원 검토의견서 생성 완료!')
     print(f'✅ 성공: {generated}개 파일')
     print(f'❌ 오류: {errors}개 파일')
-    print(f'📊 성공률: {generated/(generated+errors)*100:.1f}%')
+    print(f'📊 성공률: {generated/(generated+errors)*100:.1f}%' if generated + errors else '📊 변경된 사업 없음')
     print(f'📁 저장 위치: 검토의견서/ 폴더')
-    print(f'📄 파일 형식: 급수_우선순위%_부처명_과제명(키워드).md')
+    print(f'📄 파일 형식: 급수_우선순위%_부처명_과제명(키워드)_구분해시.md')
     print(f'📋 분량: A4 4장 (약 8,000자)')